@@ -7,19 +7,105 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import queue
+import concurrent.futures
 import sys
 import os
 import time
 import re
+import copy
+import importlib.util
+from functools import lru_cache
+from itertools import islice
+from types import SimpleNamespace, MappingProxyType
+from collections import deque, Counter
 from datetime import datetime
 import json
 
+# orjson is optional; the settings file is read and written as bytes with either backend
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+    
+    _json_loads = json.loads
+
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import our modules
+# Import our modules. Selenium, the shopping adapters and the voice stack are
+# slow to import, so only their availability is probed here; the _lazy_*
+# helpers below import them on first use.
 try:
     from grocery_manager import GroceryListManager
+    from requirement_fulfillment import RequirementAnalyzer, ProductRecommendationEngine, SatisfactionChecker
+    AI_FEATURES_AVAILABLE = True
+except ImportError as e:
+    AI_FEATURES_AVAILABLE = False
+    print(f"Some modules not available: {e}")
+
+def _module_available(name):
+    """Check whether a module can be imported without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+SELENIUM_AVAILABLE = _module_available("selenium") and _module_available("webdriver_manager")
+GROCERY_AVAILABLE = SELENIUM_AVAILABLE
+VOICE_AVAILABLE = _module_available("speech_recognition") and _module_available("pyttsx3")
+
+@lru_cache(maxsize=1)
+def _lazy_selenium():
+    """Import the Selenium stack and webdriver-manager."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
+    from webdriver_manager.chrome import ChromeDriverManager
+    return SimpleNamespace(webdriver=webdriver, Service=Service, Options=Options,
+                           WebDriverWait=WebDriverWait, ChromeDriverManager=ChromeDriverManager,
+                           StaleElementReferenceException=StaleElementReferenceException,
+                           NoSuchElementException=NoSuchElementException)
+
+@lru_cache(maxsize=1)
+def _chromedriver_path():
+    """Resolve the chromedriver binary once; install() does an HTTP version check."""
+    return _lazy_selenium().ChromeDriverManager().install()
+
+# Persistent profiles so warm starts skip Chrome's first-run profile setup;
+# each concurrently running browser needs a directory of its own
+CHROME_PROFILE_DIR = os.path.expanduser(os.path.join("~", ".aiva", "chrome"))
+
+# Voice picked for text-to-speech on the first run, reused so later starts skip the voice scan
+TTS_CACHE_FILE = os.path.expanduser(os.path.join("~", ".aiva", "tts_cache.json"))
+
+# Utterances allowed to wait for the speech worker; older ones are dropped once it falls behind
+TTS_MAX_QUEUED = 3
+
+# Seconds the voice tutorial gives the user to try each suggested command
+TUTORIAL_TRY_SECONDS = 5
+
+# Consecutive recognition failures before the voice session is recovered
+VOICE_MAX_RETRIES = 3
+
+# Run Chrome without a window (set AIVA_HEADLESS=1); off by default so logins and carts stay visible
+HEADLESS = os.environ.get("AIVA_HEADLESS") == "1"
+
+# Sites searched side by side by "Compare Sites", and how long to wait for
+# their searches once the browsers are up (Amazon's search alone pauses about 9 s)
+COMPARE_SERVICES = ('flipkart', 'amazon')
+COMPARE_TIMEOUT = 30
+
+# The last single-site search is reused for a repeated query while its results page is still loaded
+SEARCH_CACHE_TTL = 300  # seconds
+
+@lru_cache(maxsize=1)
+def _lazy_adapters():
+    """Import the e-commerce and grocery website adapters."""
     # Try enhanced adapters first, fallback to original
     try:
         from enhanced_adapters import FlipkartAdapter, AmazonAdapter
@@ -29,24 +115,218 @@ try:
         print("⚠️ Using original adapters")
     
     from grocery_adapters import BlinkitAdapter
-    from requirement_fulfillment import RequirementAnalyzer, ProductRecommendationEngine, SatisfactionChecker
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.chrome.options import Options
-    from webdriver_manager.chrome import ChromeDriverManager
-    import speech_recognition as sr
+    return SimpleNamespace(FlipkartAdapter=FlipkartAdapter, AmazonAdapter=AmazonAdapter,
+                           BlinkitAdapter=BlinkitAdapter)
+
+@lru_cache(maxsize=1)
+def _lazy_sr():
+    """Import the speech_recognition module."""
+    import speech_recognition
+    return speech_recognition
+
+@lru_cache(maxsize=1)
+def _lazy_tts():
+    """Import the pyttsx3 module."""
     import pyttsx3
-    VOICE_AVAILABLE = True
-    SELENIUM_AVAILABLE = True
-    GROCERY_AVAILABLE = True
-    AI_FEATURES_AVAILABLE = True
-except ImportError as e:
-    VOICE_AVAILABLE = False
-    SELENIUM_AVAILABLE = False
-    GROCERY_AVAILABLE = False
-    AI_FEATURES_AVAILABLE = False
-    print(f"Some modules not available: {e}")
+    return pyttsx3
+
+# Output panel font and the text tags used for colored output
+MONO_FONT = ("Consolas", 10)
+MONO_BOLD_FONT = ("Consolas", 10, "bold")
+OUTPUT_TAGS = {
+    "success": {"foreground": "green"},
+    "error": {"foreground": "red"},
+    "warning": {"foreground": "orange"},
+    "info": {"foreground": "blue"},
+    "header": {"font": MONO_BOLD_FONT},
+}
+
+SETTINGS_FILE = 'aiva_settings.json'
+
+@lru_cache(maxsize=16)
+def _parse_location(location):
+    """Split a location entry into (pincode, area); it is either a pincode or "area, pincode"."""
+    if ',' in location:
+        parts = [part.strip() for part in location.split(',')]
+        if len(parts) >= 2:
+            return parts[1], parts[0]
+    return location, None
+
+# Text-to-speech cleanup: status emojis are dropped and abbreviations spelled out
+_SPEECH_EMOJI_RE = re.compile(r'[🤖🎤🔍🛒🥬📍✅❌⚠️💡📊🎯]')
+_SPEECH_ABBREVIATIONS = {
+    'AIVA': 'Aiva',
+    'GUI': 'graphical user interface',
+    'API': 'A P I',
+    'URL': 'U R L',
+    'TTS': 'text to speech',
+    'AI': 'artificial intelligence'
+}
+_SPEECH_ABBR_RE = re.compile(r'\b(?:' + '|'.join(_SPEECH_ABBREVIATIONS) + r')\b')
+
+# Voice command keywords by category; a command mentions a category if it contains one of its keywords as whole words.
+# Matching is not by substring, so the inflected forms users say ("delivery", "ordering") are listed too
+_VOICE_KEYWORDS = {
+    'stop': ('stop', 'stopping', 'exit', 'quit', 'end'),
+    'help': ('help', 'what can you do', 'commands'),
+    'search': ('search', 'searching', 'find', 'finding', 'look for', 'show me', 'get me'),
+    'shopping': ('buy', 'buying', 'purchase', 'purchasing', 'order', 'orders', 'ordering', 'ordered',
+                 'cart', 'carts', 'checkout', 'flipkart', 'amazon'),
+    'flipkart': ('flipkart',),
+    'amazon': ('amazon',),
+    'cart': ('cart', 'carts', 'basket', 'baskets', 'checkout'),
+    'purchase': ('buy', 'buying', 'purchase', 'purchasing', 'order', 'orders', 'ordering', 'ordered'),
+    'grocery': ('grocery', 'groceries', 'food', 'foods', 'blinkit', 'deliver', 'delivers', 'delivered',
+                'delivering', 'delivery', 'deliveries', 'order food'),
+    'grocery_mode': ('blinkit', 'grocery', 'groceries'),
+    'location': ('location', 'locations', 'address', 'addresses'),
+    'order': ('order', 'orders', 'ordering', 'ordered'),
+    'settings': ('settings', 'config', 'configure', 'configuration', 'setup', 'change', 'changes',
+                 'changing', 'changed'),
+    'voice': ('voice', 'voices'),
+    'faster': ('faster', 'speed up'),
+    'slower': ('slower', 'slow down'),
+    'volume': ('volume',),
+    'louder': ('up', 'louder'),
+    'quieter': ('down', 'quieter'),
+}
+
+def _compile_voice_keywords(keywords):
+    """Categories per keyword, and one regex finding the multi-word keywords."""
+    categories = {}
+    for category, keywords_in_category in keywords.items():
+        for keyword in keywords_in_category:
+            categories.setdefault(keyword, set()).add(category)
+    
+    phrases = sorted((keyword for keyword in categories if ' ' in keyword), key=len, reverse=True)
+    phrase_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, phrases)) + r')\b')
+    return {keyword: frozenset(cats) for keyword, cats in categories.items()}, phrase_re
+
+_VOICE_KEYWORD_CATEGORIES, _VOICE_PHRASE_RE = _compile_voice_keywords(_VOICE_KEYWORDS)
+
+def _voice_command_categories(command):
+    """Categories of the keywords in the command, matched as whole words."""
+    tokens = command.split()
+    hits = set()
+    for token in tokens:
+        hits |= _VOICE_KEYWORD_CATEGORIES.get(token, frozenset())
+    
+    # Multi-word keywords are found in one scan of the whitespace-normalized command
+    for match in _VOICE_PHRASE_RE.finditer(' '.join(tokens)):
+        hits |= _VOICE_KEYWORD_CATEGORIES[match[0]]
+    return hits
+
+def _trigger_re(*triggers):
+    """Whole-word pattern for trigger phrases, longest first so "search for" wins over "search"."""
+    alternation = '|'.join(map(re.escape, sorted(triggers, key=len, reverse=True)))
+    return re.compile(rf'\b(?:{alternation})\b')
+
+# Trigger words stripped from voice commands to leave the product or item
+_SEARCH_TRIGGER_RE = _trigger_re('search for', 'searching for', 'find', 'finding', 'look for', 'show me',
+                                  'get me', 'search', 'searching')
+_PRODUCT_TRIGGER_RE = _trigger_re('buy', 'buying', 'purchase', 'purchasing', 'order', 'ordering',
+                                  'get me', 'i want', 'i need')
+_GROCERY_TRIGGER_RE = _trigger_re('order', 'ordering', 'get', 'buy', 'buying', 'add', 'i need', 'i want')
+_QUERY_STOP_WORDS = frozenset({'a', 'an', 'the', 'some', 'any'})
+
+def _extract_search_query(command):
+    """Extract search query from voice command."""
+    # Remove trigger words
+    words = _SEARCH_TRIGGER_RE.sub('', command).split()
+    
+    # Remove common stop words at the beginning/end
+    start = 0
+    while start < len(words) and words[start] in _QUERY_STOP_WORDS:
+        start += 1
+    end = len(words)
+    while end > start and words[end - 1] in _QUERY_STOP_WORDS:
+        end -= 1
+    
+    return ' '.join(words[start:end])
+
+def _extract_product_from_command(command):
+    """Extract product name from shopping commands."""
+    # Remove shopping trigger words, collapsing the gaps they leave behind
+    return ' '.join(_PRODUCT_TRIGGER_RE.sub('', command).split())
+
+def _extract_grocery_item(command):
+    """Extract grocery item from command."""
+    # Remove grocery trigger words
+    return ' '.join(_GROCERY_TRIGGER_RE.sub('', command).split())
+
+@lru_cache(maxsize=256)
+def _classify_voice_command(command):
+    """(action, payload) for a lowercased voice command; cached since users repeat commands."""
+    hits = _voice_command_categories(command)
+    
+    if 'stop' in hits:
+        return 'stop', None
+    if 'help' in hits:
+        return 'help', None
+    if 'search' in hits:
+        return 'search', _extract_search_query(command)
+    
+    # Every shopping keyword selects one of these
+    if 'shopping' in hits:
+        if 'flipkart' in hits:
+            return 'platform', 'flipkart'
+        if 'amazon' in hits:
+            return 'platform', 'amazon'
+        if 'cart' in hits:
+            return 'cart', None
+        return 'purchase', _extract_product_from_command(command)
+    
+    # Other grocery mentions (e.g. "deliver") fall through to settings
+    if 'grocery' in hits:
+        if 'grocery_mode' in hits:
+            return 'grocery_mode', None
+        if 'location' in hits:
+            return 'location', None
+        if 'order' in hits:
+            return 'grocery_order', _extract_grocery_item(command)
+    
+    if 'settings' in hits:
+        if 'voice' in hits:
+            if 'faster' in hits:
+                return 'speech_rate', 1.2
+            if 'slower' in hits:
+                return 'speech_rate', 0.8
+            if 'volume' in hits:
+                if 'louder' in hits:
+                    return 'speech_volume', 1.0
+                if 'quieter' in hits:
+                    return 'speech_volume', 0.6
+                return 'speech_volume', None
+        return 'settings', None
+    
+    return 'unknown', None
+
+# Output spoken automatically in voice mode: status tags, and results or completion messages
+_AUTO_SPEAK_TAGS = frozenset({"success", "error", "warning"})
+_AUTO_SPEAK_RE = re.compile("found|completed|ready|failed|error|success", re.I)
+_AUTO_SPEAK_STATUS_RE = re.compile("ready|completed|error|failed", re.I)
+
+# Products listed and offered for selection after a search; only these are kept on the GUI
+MAX_DISPLAYED_PRODUCTS = 10
+
+@lru_cache(maxsize=2)
+def _timestamp(second):
+    """HH:MM:SS for an epoch second; formatted once per second however many lines share it."""
+    return time.strftime("%H:%M:%S", time.localtime(second))
+
+@lru_cache(maxsize=2)
+def _iso_timestamp(second):
+    """ISO 8601 local time for an epoch second, shared like _timestamp."""
+    return datetime.fromtimestamp(second).isoformat(timespec='seconds')
+
+# Messages handled per Tk callback; a larger backlog continues on the next idle turn
+MESSAGE_BATCH_LIMIT = 256
+
+# Lines kept in the output panel; older lines are dropped from the top
+OUTPUT_MAX_LINES = 500
+
+# Budget entry contents: a whole number of rupees, surrounding spaces allowed
+_BUDGET_RE = re.compile(r"^\s*(\d+)\s*$")
     
 # Additional imports for GUI
 try:
@@ -54,9 +334,67 @@ try:
 except ImportError:
     pass
 
+class MessageChannel:
+    """Worker-to-GUI message channel that wakes the Tk loop only when posted to."""
+    
+    def __init__(self, root, event_name="<<AivaMsg>>"):
+        self.root = root
+        self.event_name = event_name
+        self._messages = deque()
+        self._wakeup_pending = False
+    
+    def put(self, message):
+        """Queue a message and ask the Tk loop to process it."""
+        self._messages.append(message)
+        if self._wakeup_pending:
+            return
+        self._wakeup_pending = True
+        try:
+            self.root.event_generate(self.event_name, when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window closing or main loop not running yet; the next post drains this too
+            self._wakeup_pending = False
+    
+    def drain(self, limit):
+        """Yield up to limit queued messages in order (call from the Tk thread only)."""
+        self._wakeup_pending = False
+        messages = self._messages
+        for _ in range(limit):
+            if not messages:
+                return
+            yield messages.popleft()
+    
+    def pending(self):
+        """True if messages are waiting to be drained."""
+        return bool(self._messages)
+
 class AIVAGui:
     """Main GUI for AIVA Voice Assistant."""
     
+    # Messages for recognized voice error types, shared by every handle_voice_errors call
+    _ERROR_RESPONSES = MappingProxyType({
+        'timeout': {
+            'message': "⏰ Voice timeout - I didn't hear anything",
+            'speech': "I didn't hear you. Please try speaking again, or say stop to exit voice mode.",
+            'suggestion': "💡 Speak clearly and ensure your microphone is working"
+        },
+        'recognition': {
+            'message': "❓ Could not understand what you said",
+            'speech': "I couldn't understand that. Please speak clearly and try again.",
+            'suggestion': "💡 Try speaking slower or rephrasing your command"
+        },
+        'network': {
+            'message': "🌐 Network error - speech recognition service unavailable",
+            'speech': "Network error. Speech recognition is temporarily unavailable.",
+            'suggestion': "💡 Check your internet connection and try again"
+        },
+        'microphone': {
+            'message': "🎤 Microphone error - check your audio input",
+            'speech': "Microphone error. Please check your audio settings.",
+            'suggestion': "💡 Ensure your microphone is connected and not muted"
+        }
+    })
+    
     def __init__(self, root):
         self.root = root
         self.root.title("AIVA - AI Voice Assistant")
@@ -65,44 +403,87 @@ class AIVAGui:
         
         # Initialize components
         self.grocery_manager = GroceryListManager()
+        self._list_names_cache = None
+        self._settings_cache = None
+        self._settings_mtime = None
         self.current_service = None
         self.driver = None
+        self._browser_lock = threading.Lock()  # held while the main browser starts
+        self._closing = False  # set by on_closing; no browser is started after it
+        self._adapters = {}
+        self._wait = None
+        self._blinkit_location = None  # (pincode, area) last applied on Blinkit
+        self._search_fns = {
+            'flipkart': self.search_flipkart,
+            'amazon': self.search_amazon,
+            'blinkit': self.search_blinkit,
+        }
+        # Compare searches run each site on its own browser in a worker pool
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(COMPARE_SERVICES),
+                                                           thread_name_prefix="aiva-compare")
+        # Searches, cart, order and voice operations share a few long-lived worker threads
+        self._workers = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="aiva-worker")
+        # Submitted futures not yet finished, cancelled on close (cancel_futures needs Python 3.9)
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._drivers = {}
+        self._compare_adapters = {}
+        # Compare sites with a search still running; a timed-out search keeps its browser busy
+        self._compare_busy = set()
+        self._compare_lock = threading.Lock()
         self.voice_enabled = VOICE_AVAILABLE
         
+        # Voice state management (read by output and search code even without voice support)
+        self.is_listening = False
+        self.voice_active = False
+        self._stop_listening = None
+        self._voice_retries = 0
+        
         # Initialize AI components
         if AI_FEATURES_AVAILABLE:
             self.requirement_analyzer = RequirementAnalyzer()
             self.recommendation_engine = ProductRecommendationEngine(self.requirement_analyzer)
             self.satisfaction_checker = SatisfactionChecker(self.requirement_analyzer)
+            # Parsing is a pure function of the query text and repeat searches are common
+            self._analyze = lru_cache(maxsize=256)(self.requirement_analyzer.analyze_query)
         else:
             self.requirement_analyzer = None
             self.recommendation_engine = None
             self.satisfaction_checker = None
+            self._analyze = None
+        
+        # ((service, normalized query), time searched, products) of the last search; read from worker threads
+        self._last_search = None
+        self._search_lock = threading.Lock()
         
         # Shopping session state
         self.current_products = []
         self.current_requirements = None
         self.cart_items = []
+        self._cart_total = 0  # running sum of cart_items prices
         self.shopping_session_active = False
         
+        # What the product combobox currently shows
+        self._product_options = ()
+        
         # Initialize voice components if available
         if self.voice_enabled:
             try:
                 # Enhanced voice recognition setup
-                self.recognizer = sr.Recognizer()
+                self.recognizer = _lazy_sr().Recognizer()
                 
                 # Improved microphone initialization with device selection
                 self.microphone = self._initialize_microphone()
                 
-                # Enhanced TTS engine setup
+                # Enhanced TTS engine setup; pyttsx3 is not thread-safe, so one worker owns say/runAndWait
                 self.tts_engine = self._initialize_tts_engine()
+                self._tts_q = queue.Queue()
+                self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+                self._tts_thread.start()
                 
                 # Voice recognition settings
                 self._configure_voice_recognition()
                 
-                # Voice state management
-                self.is_listening = False
-                self.voice_active = False
                 self.last_command_time = 0
                 
                 print("✅ Voice system initialized successfully")
@@ -112,17 +493,22 @@ class AIVAGui:
                 print(f"❌ Voice initialization failed: {e}")
                 print("   Install: pip install speechrecognition pyttsx3 pyaudio")
         
-        # Message queue for thread communication
-        self.message_queue = queue.Queue()
+        # Message channel for thread communication
+        self.message_queue = MessageChannel(self.root)
         
         # Setup GUI
         self.setup_gui()
         
-        # Start message processor
-        self.process_messages()
+        # Process worker messages as soon as they are posted
+        self.root.bind("<<AivaMsg>>", lambda e: self.process_messages())
+        self.root.after(1000, self._message_fallback_poll)
         
         # Load user settings
         self.load_settings()
+        
+        # Start Chrome now so the first search does not pay for its cold start
+        if SELENIUM_AVAILABLE:
+            threading.Thread(target=self._prewarm_browser, daemon=True).start()
     
     def setup_gui(self):
         """Setup the main GUI interface."""
@@ -277,6 +663,8 @@ class AIVAGui:
                   command=self.start_smart_search).grid(row=0, column=0, padx=(0, 5), pady=2)
         ttk.Button(button_frame1, text="🛒 View Cart", 
                   command=self.view_cart).grid(row=0, column=1, padx=5, pady=2)
+        ttk.Button(button_frame1, text="⚖️ Compare Sites", 
+                  command=self.start_compare_search).grid(row=1, column=0, columnspan=2, pady=2)
         
         # Shopping session controls
         session_frame = ttk.LabelFrame(scrollable_frame, text="Shopping Session", padding="5")
@@ -305,37 +693,29 @@ class AIVAGui:
         self.product_combo = ttk.Combobox(session_frame, textvariable=self.product_var, width=40)
         self.product_combo.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
         
-        # Grocery specific controls
-        self.grocery_frame = ttk.LabelFrame(scrollable_frame, text="Grocery Lists", padding="5")
-        self.grocery_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        # List selection
-        ttk.Label(self.grocery_frame, text="Select List:").grid(row=0, column=0, sticky=tk.W)
+        # Grocery list and settings controls live in tabs that are only built when first shown;
+        # their values are kept in variables so they can be read before that
         self.list_var = tk.StringVar()
-        self.list_combo = ttk.Combobox(self.grocery_frame, textvariable=self.list_var, 
-                                      values=list(self.grocery_manager.get_all_lists().keys()))
-        self.list_combo.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        self.location_var = tk.StringVar()
+        self.list_combo = None
         
-        ttk.Button(self.grocery_frame, text="📋 Show List", 
-                  command=self.show_selected_list).grid(row=2, column=0, padx=(0, 5), pady=5)
-        ttk.Button(self.grocery_frame, text="🛍️ Order List", 
-                  command=self.order_selected_list).grid(row=2, column=1, padx=5, pady=5)
+        self.options_notebook = ttk.Notebook(scrollable_frame)
+        self.options_notebook.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
         
-        # Settings frame
-        settings_frame = ttk.LabelFrame(scrollable_frame, text="Settings", padding="5")
-        settings_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        self._tab_builders = {}
+        self._built_tabs = set()
+        for title, builder in (("Grocery Lists", self._build_grocery_tab),
+                               ("Settings", self._build_settings_tab)):
+            tab = ttk.Frame(self.options_notebook, padding="5")
+            self.options_notebook.add(tab, text=title)
+            self._tab_builders[str(tab)] = builder
         
-        # Location setting
-        ttk.Label(settings_frame, text="Location (Pincode):").grid(row=0, column=0, sticky=tk.W)
-        self.location_entry = ttk.Entry(settings_frame, width=20)
-        self.location_entry.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
-        
-        ttk.Button(settings_frame, text="📍 Set Location", 
-                  command=self.set_location).grid(row=2, column=0, pady=5)
+        self.options_notebook.bind("<<NotebookTabChanged>>", lambda e: self._build_selected_tab())
+        self._build_selected_tab()
         
         # Control buttons
         button_frame = ttk.Frame(scrollable_frame)
-        button_frame.grid(row=5, column=0, columnspan=2, pady=10)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=10)
         
         ttk.Button(button_frame, text="🔄 Refresh", 
                   command=self.refresh_interface).grid(row=0, column=0, padx=5)
@@ -344,26 +724,57 @@ class AIVAGui:
         ttk.Button(button_frame, text="💾 Save Settings", 
                   command=self.save_settings).grid(row=0, column=2, padx=5)
     
+    def _build_selected_tab(self):
+        """Create the widgets of the selected options tab the first time it is shown."""
+        tab_name = self.options_notebook.select()
+        if tab_name and tab_name not in self._built_tabs:
+            self._built_tabs.add(tab_name)
+            self._tab_builders[tab_name](self.options_notebook.nametowidget(tab_name))
+    
+    def _build_grocery_tab(self, tab):
+        """Grocery list selection and ordering controls."""
+        ttk.Label(tab, text="Select List:").grid(row=0, column=0, sticky=tk.W)
+        self.list_combo = ttk.Combobox(tab, textvariable=self.list_var, 
+                                      values=self._list_names())
+        self.list_combo.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        
+        ttk.Button(tab, text="📋 Show List", 
+                  command=self.show_selected_list).grid(row=2, column=0, padx=(0, 5), pady=5)
+        ttk.Button(tab, text="🛍️ Order List", 
+                  command=self.order_selected_list).grid(row=2, column=1, padx=5, pady=5)
+    
+    def _build_settings_tab(self, tab):
+        """Location setting controls."""
+        ttk.Label(tab, text="Location (Pincode):").grid(row=0, column=0, sticky=tk.W)
+        self.location_entry = ttk.Entry(tab, textvariable=self.location_var, width=20)
+        self.location_entry.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        
+        ttk.Button(tab, text="📍 Set Location", 
+                  command=self.set_location).grid(row=2, column=0, pady=5)
+    
     def setup_output_panel(self, parent):
         """Setup the right output panel."""
         
         output_frame = ttk.LabelFrame(parent, text="Output", padding="10")
         output_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(5, 0))
         output_frame.columnconfigure(0, weight=1)
-        output_frame.rowconfigure(0, weight=1)
+        output_frame.rowconfigure(1, weight=1)
+        
+        # Warning banner, shown by _warn instead of a modal dialog
+        self.banner = tk.Label(output_frame, bg="#ffeaa7", fg="#2d3436", anchor="w", padx=5, pady=3)
+        self.banner.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        self.banner.grid_remove()
+        self._banner_job = None
         
         # Output text area with scrollbar
         self.output_text = scrolledtext.ScrolledText(output_frame, wrap=tk.WORD, 
                                                     height=25, width=60, 
-                                                    font=("Consolas", 10))
-        self.output_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+                                                    font=MONO_FONT)
+        self.output_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Configure text tags for colored output
-        self.output_text.tag_configure("success", foreground="green")
-        self.output_text.tag_configure("error", foreground="red")
-        self.output_text.tag_configure("warning", foreground="orange")
-        self.output_text.tag_configure("info", foreground="blue")
-        self.output_text.tag_configure("header", font=("Consolas", 10, "bold"))
+        for tag, options in OUTPUT_TAGS.items():
+            self.output_text.tag_configure(tag, **options)
         
         # Initial welcome message
         self.add_output("🤖 Welcome to AIVA - AI Voice Assistant!", "header")
@@ -371,6 +782,29 @@ class AIVAGui:
         if not self.voice_enabled:
             self.add_output("⚠️ Voice features disabled. Install speech_recognition and pyttsx3 for voice control.", "warning")
     
+    def _emit_batch(self, lines):
+        """Post several (text, tag) output lines as one message."""
+        if lines:
+            self.message_queue.put(("output_batch", lines))
+    
+    def _warn(self, message):
+        """Show a warning in the banner above the output; it hides itself after 3 seconds."""
+        # Voice-started searches validate input on a worker thread; Tk is only touched on the main one
+        if threading.current_thread() is not threading.main_thread():
+            self.message_queue.put(("warn", message))
+            return
+        
+        self.banner.config(text=f"⚠️ {message}")
+        self.banner.grid()
+        if self._banner_job:
+            self.root.after_cancel(self._banner_job)
+        self._banner_job = self.root.after(3000, self._hide_banner)
+    
+    def _hide_banner(self):
+        """Hide the warning banner."""
+        self._banner_job = None
+        self.banner.grid_remove()
+    
     def setup_status_bar(self, parent):
         """Setup the status bar."""
         
@@ -406,14 +840,14 @@ class AIVAGui:
         query = self.search_entry.get().strip()
         if not query:
             message = "Please enter a search query."
-            messagebox.showwarning("Warning", message)
+            self._warn(message)
             if self.voice_active:
                 self.speak("Please enter what you'd like to search for")
             return
         
         if not self.current_service:
             message = "Please select a service first."
-            messagebox.showwarning("Warning", message)
+            self._warn(message)
             if self.voice_active:
                 self.speak("Please select a platform like Amazon or Flipkart first")
             return
@@ -423,9 +857,7 @@ class AIVAGui:
             self.speak(f"Starting search for {query} on {self.current_service}")
         
         # Start search in thread to prevent GUI freezing
-        thread = threading.Thread(target=self.perform_search, args=(query,))
-        thread.daemon = True
-        thread.start()
+        self._submit(self.perform_search, query)
     
     def start_smart_search(self):
         """Enhanced start intelligent product search with voice guidance and requirement analysis."""
@@ -433,43 +865,29 @@ class AIVAGui:
         query = self.search_entry.get().strip()
         if not query:
             message = "Please enter a search query."
-            messagebox.showwarning("Warning", message)
+            self._warn(message)
             if self.voice_active:
                 self.speak("Please enter what you'd like to search for")
             return
         
         if not self.current_service:
             message = "Please select a service first."
-            messagebox.showwarning("Warning", message)
+            self._warn(message)
             if self.voice_active:
                 self.speak("Please select a platform first")
             return
         
-        # Voice guidance for smart search
-        if self.voice_active:
-            self.speak(f"Starting intelligent search for {query}. I'll analyze your requirements and find the best options.")
-        
-        # Start smart search in thread
-        thread = threading.Thread(target=self.perform_smart_search, args=(query,))
-        thread.daemon = True
-        thread.start()
-        if not query:
-            messagebox.showwarning("Warning", "Please enter a search query.")
-            return
-        
-        if not self.current_service:
-            messagebox.showwarning("Warning", "Please select a service first.")
-            return
-        
         if not AI_FEATURES_AVAILABLE:
-            messagebox.showwarning("Warning", "AI features not available. Using basic search.")
+            self._warn("AI features not available. Using basic search.")
             self.start_search()
             return
         
+        # Voice guidance for smart search
+        if self.voice_active:
+            self.speak(f"Starting intelligent search for {query}. I'll analyze your requirements and find the best options.")
+        
         # Start smart search in thread
-        thread = threading.Thread(target=self.perform_smart_search, args=(query,))
-        thread.daemon = True
-        thread.start()
+        self._submit(self.perform_smart_search, query)
     
     def perform_smart_search(self, query):
         """Perform intelligent search with requirement analysis."""
@@ -488,7 +906,8 @@ class AIVAGui:
             if budget_max > 0:
                 enhanced_query += f" under {budget_max}"
             
-            requirements = self.requirement_analyzer.analyze_query(enhanced_query)
+            # Copy the cached result since the budget fields are adjusted below
+            requirements = copy.copy(self._analyze(enhanced_query))
             # Ensure budget values are properly set
             if budget_min > 0:
                 requirements.budget_min = budget_min
@@ -502,17 +921,19 @@ class AIVAGui:
             
             self.current_requirements = requirements
             
-            self.message_queue.put(("output", f"📊 Requirements detected:", "info"))
-            self.message_queue.put(("output", f"   Category: {requirements.category}", ""))
-            self.message_queue.put(("output", f"   Budget: ₹{requirements.budget_min} - ₹{requirements.budget_max}", ""))
+            lines = [
+                ("📊 Requirements detected:", "info"),
+                (f"   Category: {requirements.category}", ""),
+                (f"   Budget: ₹{requirements.budget_min} - ₹{requirements.budget_max}", ""),
+            ]
             if requirements.features:
-                self.message_queue.put(("output", f"   Features: {', '.join(requirements.features)}", ""))
+                lines.append((f"   Features: {', '.join(requirements.features)}", ""))
             if requirements.brand_preference:
-                self.message_queue.put(("output", f"   Brands: {', '.join(requirements.brand_preference)}", ""))
+                lines.append((f"   Brands: {', '.join(requirements.brand_preference)}", ""))
+            self._emit_batch(lines)
             
             # Initialize browser if needed
-            if not self.driver:
-                self.init_browser()
+            self._ensure_browser()
             
             # Perform search
             self.message_queue.put(("output", f"🔍 Searching for products...", "info"))
@@ -522,7 +943,7 @@ class AIVAGui:
                 # Rank products using AI
                 self.message_queue.put(("output", f"🎯 Analyzing {len(products)} products...", "info"))
                 ranked_products = self.recommendation_engine.rank_products(products, requirements)
-                self.current_products = ranked_products
+                self.current_products = ranked_products[:MAX_DISPLAYED_PRODUCTS]
                 
                 # Check satisfaction
                 satisfaction = self.satisfaction_checker.check_satisfaction(ranked_products, requirements)
@@ -531,7 +952,7 @@ class AIVAGui:
                 self._display_smart_results(ranked_products, satisfaction)
                 
                 # Update product selection dropdown
-                self._update_product_selection(ranked_products)
+                self._update_product_selection(self.current_products)
                 
                 # Update session status
                 self.shopping_session_active = True
@@ -549,50 +970,69 @@ class AIVAGui:
     
     def _parse_budget(self, budget_str):
         """Parse budget string to integer."""
-        try:
-            return int(budget_str.strip()) if budget_str.strip() else 0
-        except:
-            return 0
+        # Placeholders ("Min"/"Max") and other non-numeric input count as no budget
+        match = _BUDGET_RE.match(budget_str)
+        return int(match[1]) if match else 0
     
     def _search_products(self, query):
         """Search products based on current service."""
-        if self.current_service == 'flipkart':
-            return self.search_flipkart(query)
-        elif self.current_service == 'amazon':
-            return self.search_amazon(query)
-        elif self.current_service == 'blinkit':
-            return self.search_blinkit(query)
-        else:
+        search = self._search_fns.get(self.current_service)
+        if not search:
             return []
+        key = (self.current_service, query.lower().strip())
+        with self._search_lock:
+            last = self._last_search
+        if last and last[0] == key and time.time() - last[1] < SEARCH_CACHE_TTL and self._results_live(last[2]):
+            return last[2]
+        
+        products = search(query)
+        if products:
+            with self._search_lock:
+                self._last_search = (key, time.time(), products)
+        return products
+    
+    def _results_live(self, products):
+        """True if the products' elements are still on the loaded page, so they can be added to the cart."""
+        element = products[0].get('element')
+        if element is None:
+            return False
+        try:
+            element.is_enabled()
+            return True
+        except Exception:
+            return False
     
     def _display_smart_results(self, products, satisfaction):
         """Display smart search results with analysis."""
+        lines = []
+        append = lines.append
         
         if satisfaction['satisfied']:
-            self.message_queue.put(("output", f"✅ {satisfaction['reason']}", "success"))
+            append((f"✅ {satisfaction['reason']}", "success"))
             best_product = satisfaction['best_product']
-            self.message_queue.put(("output", f"🏆 TOP RECOMMENDATION:", "header"))
-            self._display_product_details(best_product, 1)
+            append(("🏆 TOP RECOMMENDATION:", "header"))
+            self._display_product_details(best_product, 1, lines)
             
             if satisfaction.get('alternatives'):
-                self.message_queue.put(("output", f"🔄 ALTERNATIVES:", "info"))
+                append(("🔄 ALTERNATIVES:", "info"))
                 for i, product in enumerate(satisfaction['alternatives'], 2):
-                    self._display_product_details(product, i)
+                    self._display_product_details(product, i, lines)
         else:
-            self.message_queue.put(("output", f"⚠️ {satisfaction['reason']}", "warning"))
+            append((f"⚠️ {satisfaction['reason']}", "warning"))
             
             if satisfaction.get('suggestions'):
-                self.message_queue.put(("output", f"💡 SUGGESTIONS:", "info"))
-                for suggestion in satisfaction['suggestions']:
-                    self.message_queue.put(("output", f"   • {suggestion}", ""))
+                append(("💡 SUGGESTIONS:", "info"))
+                lines.extend((f"   • {suggestion}", "") for suggestion in satisfaction['suggestions'])
             
             if satisfaction.get('partial_matches'):
-                self.message_queue.put(("output", f"🔍 BEST AVAILABLE OPTIONS:", "info"))
+                append(("🔍 BEST AVAILABLE OPTIONS:", "info"))
                 for i, product in enumerate(satisfaction['partial_matches'], 1):
-                    self._display_product_details(product, i)
+                    self._display_product_details(product, i, lines)
+        
+        self._emit_batch(lines)
     
-    def _display_product_details(self, product, rank):
-        """Display detailed product information."""
+    def _display_product_details(self, product, rank, lines):
+        """Append detailed product information to a batch of output lines."""
         title = product.get('title', 'Unknown')
         price = product.get('price', 0)
         score = product.get('match_score', 0)
@@ -602,34 +1042,31 @@ class AIVAGui:
         price_text = f"₹{price}" if price > 0 else "Price not available"
         rating_text = f" ({rating}⭐)" if rating else ""
         
-        self.message_queue.put(("output", f"  {rank}. {title[:70]}...", ""))
-        self.message_queue.put(("output", f"     💰 {price_text} | 🎯 {score:.1f}% match{rating_text}", ""))
+        lines.append((f"  {rank}. {title[:70]}...", ""))
+        lines.append((f"     💰 {price_text} | 🎯 {score:.1f}% match{rating_text}", ""))
         
         if reasons:
-            self.message_queue.put(("output", f"     ✨ {', '.join(reasons[:2])}", ""))
+            lines.append((f"     ✨ {', '.join(reasons[:2])}", ""))
     
     def _update_product_selection(self, products):
         """Update product selection dropdown."""
-        product_options = []
-        for i, product in enumerate(products[:10], 1):
-            title = product.get('title', 'Unknown')[:50]
-            price = product.get('price', 0)
-            score = product.get('match_score', 0)
-            option = f"{i}. {title}... - ₹{price} ({score:.1f}%)"
-            product_options.append(option)
-        
-        self.message_queue.put(("update_products", product_options))
+        # The message handler skips the combobox write when these options are unchanged
+        options = tuple(
+            f"{i}. {product.get('title', 'Unknown')[:50]}... - ₹{product.get('price', 0)} ({product.get('match_score', 0):.1f}%)"
+            for i, product in enumerate(islice(products, MAX_DISPLAYED_PRODUCTS), 1)
+        )
+        self.message_queue.put(("update_products", options))
     
     def add_selected_to_cart(self):
         """Add selected product to cart."""
         
         if not self.shopping_session_active or not self.current_products:
-            messagebox.showwarning("Warning", "No active shopping session. Please search for products first.")
+            self._warn("No active shopping session. Please search for products first.")
             return
         
         selection = self.product_var.get()
         if not selection:
-            messagebox.showwarning("Warning", "Please select a product from the dropdown.")
+            self._warn("Please select a product from the dropdown.")
             return
         
         # Extract product index from selection
@@ -638,12 +1075,10 @@ class AIVAGui:
             selected_product = self.current_products[product_index]
             
             # Start cart operation in thread
-            thread = threading.Thread(target=self.perform_add_to_cart, args=(selected_product,))
-            thread.daemon = True
-            thread.start()
+            self._submit(self.perform_add_to_cart, selected_product)
             
         except (ValueError, IndexError):
-            messagebox.showerror("Error", "Invalid product selection.")
+            self._warn("Invalid product selection.")
     
     def perform_add_to_cart(self, product):
         """Add product to cart with enhanced adapter."""
@@ -658,11 +1093,12 @@ class AIVAGui:
                 self.message_queue.put(("output", f"❌ Product element not found for cart operation", "error"))
                 return
             
-            if self.current_service == 'flipkart':
-                adapter = FlipkartAdapter(self.driver, WebDriverWait(self.driver, 10))
-                success = adapter.add_to_cart(product_element)  # Pass the selenium element
-            elif self.current_service == 'amazon':
-                adapter = AmazonAdapter(self.driver, WebDriverWait(self.driver, 10))
+            # Compare-search results carry the adapter of the browser they were found on
+            adapter = product.get('adapter')
+            if adapter is None and self.current_service in ('flipkart', 'amazon'):
+                adapter = self._get_adapter(self.current_service)
+            
+            if adapter is not None:
                 success = adapter.add_to_cart(product_element)  # Pass the selenium element
             else:
                 success = False
@@ -670,6 +1106,7 @@ class AIVAGui:
             
             if success:
                 self.cart_items.append(product)
+                self._cart_total += product.get('price', 0) or 0
                 self.message_queue.put(("output", f"✅ Added to cart: {product['title'][:50]}...", "success"))
                 self.message_queue.put(("session_status", f"Cart: {len(self.cart_items)} items"))
                 
@@ -692,7 +1129,7 @@ class AIVAGui:
             return
         
         # Analyze cart contents
-        total_value = sum(item.get('price', 0) for item in self.cart_items)
+        total_value = self._cart_total
         
         self.message_queue.put(("output", f"📊 CART ANALYSIS:", "header"))
         self.message_queue.put(("output", f"   Items: {len(self.cart_items)}", ""))
@@ -712,7 +1149,7 @@ class AIVAGui:
         """Refine search based on current requirements."""
         
         if not self.shopping_session_active:
-            messagebox.showwarning("Warning", "No active shopping session.")
+            self._warn("No active shopping session.")
             return
         
         # Ask for refinement criteria
@@ -739,24 +1176,17 @@ class AIVAGui:
                 self.speak(f"Searching for {query} on {self.current_service}")
             
             # Initialize browser if needed
-            if not self.driver:
-                if self.voice_active:
-                    self.speak("Initializing browser, please wait")
-                self.init_browser()
+            if not self.driver and self.voice_active:
+                self.speak("Initializing browser, please wait")
+            self._ensure_browser()
             
             # Perform search based on service
-            if self.current_service == 'flipkart':
-                products = self.search_flipkart(query)
-            elif self.current_service == 'amazon':
-                products = self.search_amazon(query)
-            elif self.current_service == 'blinkit':
-                products = self.search_blinkit(query)
-            else:
-                products = []
+            products = self._search_products(query)
             
             # Display results with voice feedback
             if products:
-                self.current_products = products
+                # Only the listed products can be selected; dropping the rest frees their page elements
+                self.current_products = products[:MAX_DISPLAYED_PRODUCTS]
                 self.shopping_session_active = True
                 success_msg = f"Found {len(products)} products"
                 self.message_queue.put(("output", f"✅ {success_msg}:", "success"))
@@ -770,12 +1200,14 @@ class AIVAGui:
                         self.speak(f"Great! I found {len(products)} products for you. You can now select one to add to cart.")
                 
                 # Update product selection dropdown
-                self._update_product_selection(products)
+                self._update_product_selection(self.current_products)
                 
-                for i, product in enumerate(products[:10], 1):
+                lines = []
+                for i, product in enumerate(self.current_products, 1):
                     price = product.get('price', 0)
                     price_text = f"₹{price}" if price > 0 else "Price not available"
-                    self.message_queue.put(("output", f"  {i}. {product.get('title', 'Unknown')} - {price_text}", ""))
+                    lines.append((f"  {i}. {product.get('title', 'Unknown')} - {price_text}", ""))
+                self._emit_batch(lines)
             else:
                 error_msg = f"No products found for '{query}'"
                 self.message_queue.put(("output", f"❌ {error_msg}", "error"))
@@ -805,18 +1237,12 @@ class AIVAGui:
             
             self.message_queue.put(("output", "🌐 Initializing browser...", "info"))
             
-            chrome_options = Options()
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--no-sandbox")
-            # Comment out headless for testing - user can see what's happening
-            # chrome_options.add_argument("--headless")
+            self.driver = self._create_driver("default")
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Adapters and their wait are bound to the old driver
+            self._wait = self._get_wait(self.driver)
+            self._adapters.clear()
+            self._blinkit_location = None
             
             self.message_queue.put(("output", "✅ Browser initialized successfully.", "success"))
             
@@ -824,13 +1250,199 @@ class AIVAGui:
             self.message_queue.put(("output", f"❌ Browser initialization failed: {str(e)}", "error"))
             raise
     
+    def _get_wait(self, driver):
+        """Wait handed to the adapters; polls every 0.1s instead of Selenium's default 0.5s."""
+        selenium = _lazy_selenium()
+        return selenium.WebDriverWait(driver, 10, poll_frequency=0.1,
+                                      ignored_exceptions=(selenium.StaleElementReferenceException,
+                                                          selenium.NoSuchElementException))
+    
+    def _ensure_browser(self):
+        """Start the main browser unless it is running, waiting for a start already in progress."""
+        with self._browser_lock:
+            if self._closing:
+                raise Exception("AIVA is closing")
+            if not self.driver:
+                self.init_browser()
+    
+    def _prewarm_browser(self):
+        """Start the main browser in the background; a failure is retried on the first search."""
+        try:
+            self._ensure_browser()
+        except Exception:
+            pass
+    
+    def _get_adapter(self, service):
+        """Adapter for a site on the main browser, created on first use and then reused."""
+        adapter = self._adapters.get(service)
+        if adapter is None:
+            adapter_class = getattr(_lazy_adapters(), f"{service.title()}Adapter")
+            adapter = self._adapters[service] = adapter_class(self.driver, self._wait)
+        return adapter
+    
+    def _create_driver(self, profile):
+        """Start a Chrome instance tuned for automation, using the named profile directory."""
+        selenium = _lazy_selenium()
+        chrome_options = selenium.Options()
+        # Hand control back at DOMContentLoaded and skip images/notifications on product pages
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        chrome_options.add_argument(f"--user-data-dir={os.path.join(CHROME_PROFILE_DIR, profile)}")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--no-sandbox")
+        if HEADLESS:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+        
+        service = selenium.Service(_chromedriver_path(), service_args=["--silent"])
+        driver = selenium.webdriver.Chrome(service=service, options=chrome_options)
+        # Only explicit waits should block; bound page loads and scripts instead of hanging on a slow site
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(30)
+        driver.set_script_timeout(15)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
+    
+    def _submit(self, fn, *args, executor=None):
+        """Run fn on a worker pool, tracking the future so on_closing can cancel it if still queued."""
+        future = (executor or self._workers).submit(fn, *args)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+    
+    def _discard_pending(self, future):
+        """Done callback for _submit."""
+        with self._pending_lock:
+            self._pending.discard(future)
+    
+    def start_compare_search(self):
+        """Search every comparison site at once for the current query."""
+        
+        query = self.search_entry.get().strip()
+        if not query:
+            self._warn("Please enter a search query.")
+            return
+        
+        self._submit(self.perform_compare_search, query)
+    
+    def _compare_adapter(self, service):
+        """Adapter for a compare search, bound to a browser dedicated to that site."""
+        adapter = self._compare_adapters.get(service)
+        if adapter is None:
+            driver = self._drivers[service] = self._create_driver(service)
+            adapter_class = getattr(_lazy_adapters(), f"{service.title()}Adapter")
+            adapter = adapter_class(driver, self._get_wait(driver))
+            self._compare_adapters[service] = adapter
+        return adapter
+    
+    def _compare_search_one(self, service, query):
+        """Run one site's part of a compare search; called on a pool thread."""
+        adapter = self._compare_adapter(service)
+        products = adapter.search_products(query)
+        for product in products:
+            product['adapter'] = adapter
+        return products
+    
+    def _release_compare_site(self, service):
+        """Mark a compare site free for the next search."""
+        with self._compare_lock:
+            self._compare_busy.discard(service)
+    
+    def _search_all(self, query):
+        """Search every comparison site in parallel and return the merged results."""
+        if not SELENIUM_AVAILABLE:
+            raise Exception("Selenium not available. Please install selenium and webdriver-manager.")
+        
+        # A site whose previous search is still running is skipped rather than given a second task
+        with self._compare_lock:
+            services = [service for service in COMPARE_SERVICES if service not in self._compare_busy]
+            self._compare_busy.update(services)
+        for service in COMPARE_SERVICES:
+            if service not in services:
+                self.message_queue.put(("output", f"⚠️ {service.title()} is still busy with the previous search, skipping it", "warning"))
+        
+        # Browsers start before the timed wait, so a cold start does not count against COMPARE_TIMEOUT
+        starting = {self._submit(self._compare_adapter, service, executor=self._pool): service
+                    for service in services}
+        concurrent.futures.wait(starting)
+        
+        # Each site blocks on its own browser, so total time is the slowest site rather than the sum
+        futures = {}
+        for future, service in starting.items():
+            try:
+                future.result()
+            except Exception as e:
+                self._release_compare_site(service)
+                self.message_queue.put(("output", f"❌ Could not start browser for {service.title()}: {str(e)}", "error"))
+                continue
+            search = self._submit(self._compare_search_one, service, query, executor=self._pool)
+            search.add_done_callback(lambda _, service=service: self._release_compare_site(service))
+            futures[search] = service
+        done, not_done = concurrent.futures.wait(futures, timeout=COMPARE_TIMEOUT)
+        
+        products = []
+        for future in done:
+            service = futures[future]
+            try:
+                products.extend(future.result())
+            except Exception as e:
+                self.message_queue.put(("output", f"❌ {service.title()} search failed: {str(e)}", "error"))
+        for future in not_done:
+            self.message_queue.put(("output", f"⚠️ {futures[future].title()} did not respond in time", "warning"))
+        return products
+    
+    def perform_compare_search(self, query):
+        """Search all comparison sites in parallel and list the merged results by price."""
+        
+        try:
+            self.message_queue.put(("status", "Comparing sites..."))
+            self.message_queue.put(("progress", "start"))
+            sites = ", ".join(service.title() for service in COMPARE_SERVICES)
+            self.message_queue.put(("output", f"⚖️ Searching '{query}' on {sites}...", "info"))
+            
+            products = self._search_all(query)
+            if not products:
+                self.message_queue.put(("output", f"❌ No products found for '{query}'", "error"))
+                return
+            
+            # Priced products first, cheapest first
+            products.sort(key=lambda p: (p.get('price', 0) <= 0, p.get('price', 0)))
+            self.current_products = products[:MAX_DISPLAYED_PRODUCTS]
+            self.shopping_session_active = True
+            
+            self.message_queue.put(("output", f"✅ Found {len(products)} products across {sites}:", "success"))
+            self.message_queue.put(("session_status", f"Active: {len(products)} products compared"))
+            self._update_product_selection(self.current_products)
+            
+            lines = []
+            for i, product in enumerate(self.current_products, 1):
+                price = product.get('price', 0)
+                price_text = f"₹{price}" if price > 0 else "Price not available"
+                platform = product.get('platform', '').title()
+                lines.append((f"  {i}. [{platform}] {product.get('title', 'Unknown')} - {price_text}", ""))
+            self._emit_batch(lines)
+            
+        except Exception as e:
+            self.message_queue.put(("output", f"❌ Compare search failed: {str(e)}", "error"))
+        
+        finally:
+            self.message_queue.put(("progress", "stop"))
+            self.message_queue.put(("status", "Ready"))
+    
     def search_flipkart(self, query):
         """Search products on Flipkart."""
         
         try:
-            wait = WebDriverWait(self.driver, 10)
-            adapter = FlipkartAdapter(self.driver, wait)
-            return adapter.search_products(query)
+            return self._get_adapter('flipkart').search_products(query)
         except Exception as e:
             raise Exception(f"Flipkart search failed: {str(e)}")
     
@@ -838,9 +1450,7 @@ class AIVAGui:
         """Search products on Amazon."""
         
         try:
-            wait = WebDriverWait(self.driver, 10)
-            adapter = AmazonAdapter(self.driver, wait)
-            return adapter.search_products(query)
+            return self._get_adapter('amazon').search_products(query)
         except Exception as e:
             raise Exception(f"Amazon search failed: {str(e)}")
     
@@ -851,46 +1461,45 @@ class AIVAGui:
             if not GROCERY_AVAILABLE:
                 raise Exception("Grocery adapter not available. Please check grocery_adapters.py file.")
             
-            wait = WebDriverWait(self.driver, 10)
-            adapter = BlinkitAdapter(self.driver, wait)
+            adapter = self._get_adapter('blinkit')
             
             # Setup location if provided
-            location = self.location_entry.get().strip()
-            if location:
-                # Parse location - assume it's either pincode or "area, pincode"
-                if ',' in location:
-                    parts = [part.strip() for part in location.split(',')]
-                    if len(parts) >= 2:
-                        area = parts[0]
-                        pincode = parts[1]
-                    else:
-                        area = None
-                        pincode = location
-                else:
-                    area = None
-                    pincode = location
-                
-                adapter.setup_location(pincode, area)
+            self._setup_blinkit_location(adapter)
             
             return adapter.search_product(query)
         except Exception as e:
             raise Exception(f"Blinkit search failed: {str(e)}")
     
+    def _setup_blinkit_location(self, adapter):
+        """Apply the entered location on Blinkit, skipping the location picker if it is already set."""
+        location = self.location_var.get().strip()
+        if not location:
+            return True
+        
+        pincode_area = _parse_location(location)
+        if pincode_area == self._blinkit_location:
+            return True
+        
+        # The adapter only remembers that some location was set, so reset it for a new one
+        adapter.location_set = False
+        
+        result = adapter.setup_location(*pincode_area)
+        self._blinkit_location = pincode_area if result else None
+        return result
+    
     def view_cart(self):
         """View shopping cart with enhanced functionality."""
         
         if not self.current_service:
-            messagebox.showwarning("Warning", "Please select a service first.")
+            self._warn("Please select a service first.")
             return
         
         if not self.driver:
-            messagebox.showwarning("Warning", "Browser not initialized. Please search for products first.")
+            self._warn("Browser not initialized. Please search for products first.")
             return
         
         # Start cart viewing in thread
-        thread = threading.Thread(target=self.perform_view_cart)
-        thread.daemon = True
-        thread.start()
+        self._submit(self.perform_view_cart)
     
     def perform_view_cart(self):
         """Perform cart viewing operation."""
@@ -901,17 +1510,16 @@ class AIVAGui:
             
             # Show local cart items (more reliable than website cart)
             if self.cart_items:
-                self.message_queue.put(("output", f"🛒 YOUR SHOPPING CART ({len(self.cart_items)} items):", "header"))
+                lines = [(f"🛒 YOUR SHOPPING CART ({len(self.cart_items)} items):", "header")]
                 
-                total_value = 0
+                total_value = self._cart_total
                 for i, item in enumerate(self.cart_items, 1):
                     price = item.get('price', 0)
-                    total_value += price
-                    self.message_queue.put(("output", f"  {i}. {item.get('title', 'Unknown')[:60]}", ""))
-                    self.message_queue.put(("output", f"     Price: ₹{price:,}", ""))
+                    lines.append((f"  {i}. {item.get('title', 'Unknown')[:60]}", ""))
+                    lines.append((f"     Price: ₹{price:,}", ""))
                 
-                self.message_queue.put(("output", f"", ""))
-                self.message_queue.put(("output", f"💰 TOTAL VALUE: ₹{total_value:,}", "success"))
+                lines.append(("", ""))
+                lines.append((f"💰 TOTAL VALUE: ₹{total_value:,}", "success"))
                 
                 # Check if requirements are satisfied
                 if self.current_requirements and AI_FEATURES_AVAILABLE:
@@ -919,40 +1527,43 @@ class AIVAGui:
                     budget_max = self.current_requirements.budget_max or 999999
                     
                     if budget_min <= total_value <= budget_max:
-                        self.message_queue.put(("output", f"✅ Cart total fits your budget (₹{budget_min:,} - ₹{budget_max:,})", "success"))
-                        self.message_queue.put(("output", f"🎉 THANK YOU for using AIVA! Your shopping requirements are satisfied.", "success"))
-                        self.message_queue.put(("output", f"", ""))
-                        self.message_queue.put(("output", f"Would you like to:", "info"))
-                        self.message_queue.put(("output", f"  • Proceed to checkout on {self.current_service.title()}", ""))
-                        self.message_queue.put(("output", f"  • Continue shopping for more items", ""))
-                        self.message_queue.put(("output", f"  • Refine your search for better options", ""))
+                        lines += [
+                            (f"✅ Cart total fits your budget (₹{budget_min:,} - ₹{budget_max:,})", "success"),
+                            (f"🎉 THANK YOU for using AIVA! Your shopping requirements are satisfied.", "success"),
+                            ("", ""),
+                            ("Would you like to:", "info"),
+                            (f"  • Proceed to checkout on {self.current_service.title()}", ""),
+                            ("  • Continue shopping for more items", ""),
+                            ("  • Refine your search for better options", ""),
+                        ]
+                    elif total_value > budget_max:
+                        excess = total_value - budget_max
+                        lines.append((f"⚠️ Cart exceeds budget by ₹{excess:,}", "warning"))
+                        lines.append(("💡 Consider removing items or increasing budget", "info"))
                     else:
-                        if total_value > budget_max:
-                            excess = total_value - budget_max
-                            self.message_queue.put(("output", f"⚠️ Cart exceeds budget by ₹{excess:,}", "warning"))
-                            self.message_queue.put(("output", f"💡 Consider removing items or increasing budget", "info"))
-                        else:
-                            remaining = budget_min - total_value
-                            self.message_queue.put(("output", f"💡 You can add ₹{remaining:,} more to reach minimum budget", "info"))
+                        remaining = budget_min - total_value
+                        lines.append((f"💡 You can add ₹{remaining:,} more to reach minimum budget", "info"))
                 
                 # Also try to show website cart for comparison
-                self.message_queue.put(("output", f"", ""))
-                self.message_queue.put(("output", f"🌐 Checking website cart...", "info"))
+                lines.append(("", ""))
+                lines.append(("🌐 Checking website cart...", "info"))
+                self._emit_batch(lines)
                 
                 if self.current_service == 'flipkart':
                     try:
-                        adapter = FlipkartAdapter(self.driver, WebDriverWait(self.driver, 10))
-                        website_cart = adapter.view_cart()
+                        website_cart = self._get_adapter('flipkart').view_cart()
                         if website_cart:
                             self.message_queue.put(("output", f"✅ Website cart has {len(website_cart)} items", ""))
                         else:
                             self.message_queue.put(("output", f"ℹ️ Website cart appears empty (this is normal due to session management)", "info"))
-                    except:
+                    except Exception:
                         self.message_queue.put(("output", f"ℹ️ Could not check website cart", "info"))
                 
             else:
-                self.message_queue.put(("output", f"🛒 Your cart is empty", "warning"))
-                self.message_queue.put(("output", f"� Search for products and add them to cart first", "info"))
+                self._emit_batch([
+                    ("🛒 Your cart is empty", "warning"),
+                    ("� Search for products and add them to cart first", "info"),
+                ])
                 
         except Exception as e:
             self.message_queue.put(("output", f"❌ Cart viewing failed: {str(e)}", "error"))
@@ -969,14 +1580,27 @@ class AIVAGui:
     def show_grocery_manager(self):
         """Show grocery list manager window."""
         
-        GroceryManagerWindow(self.root, self.grocery_manager, self.message_queue)
+        GroceryManagerWindow(self.root, self.grocery_manager, self.message_queue,
+                             on_lists_changed=self._on_lists_changed)
+    
+    def _list_names(self):
+        """Grocery list names for the list selector, cached until a list is added."""
+        if self._list_names_cache is None:
+            self._list_names_cache = tuple(self.grocery_manager.get_all_lists().keys())
+        return self._list_names_cache
+    
+    def _on_lists_changed(self):
+        """Drop the cached list names and refresh the list selector."""
+        self._list_names_cache = None
+        if self.list_combo is not None:
+            self.list_combo['values'] = self._list_names()
     
     def show_selected_list(self):
         """Show the selected grocery list."""
         
         list_name = self.list_var.get()
         if not list_name:
-            messagebox.showwarning("Warning", "Please select a grocery list.")
+            self._warn("Please select a grocery list.")
             return
         
         grocery_list = self.grocery_manager.get_list(list_name)
@@ -1001,17 +1625,15 @@ class AIVAGui:
         
         list_name = self.list_var.get()
         if not list_name:
-            messagebox.showwarning("Warning", "Please select a grocery list.")
+            self._warn("Please select a grocery list.")
             return
         
         if self.current_service != 'blinkit':
-            messagebox.showwarning("Warning", "Please select Blinkit service for grocery ordering.")
+            self._warn("Please select Blinkit service for grocery ordering.")
             return
         
         # Start ordering in thread
-        thread = threading.Thread(target=self.perform_grocery_order, args=(list_name,))
-        thread.daemon = True
-        thread.start()
+        self._submit(self.perform_grocery_order, list_name)
     
     def perform_grocery_order(self, list_name):
         """Perform actual grocery ordering on Blinkit."""
@@ -1026,41 +1648,27 @@ class AIVAGui:
                 self.message_queue.put(("output", f"❌ Grocery list '{list_name}' not found", "error"))
                 return
                 
-            items = grocery_list['items']
+            # Repeated entries for an item are ordered with one search and their quantities summed
+            items = Counter()
+            for item in grocery_list['items']:
+                items[item['item_name']] += item['quantity']
             self.message_queue.put(("output", f"🛍️ Starting to order {len(items)} items from {list_name} list...", "info"))
             
             # Initialize browser if needed
-            if not self.driver:
-                self.message_queue.put(("output", "🌐 Initializing browser...", "info"))
-                self.init_browser()
-                time.sleep(2)
+            self._ensure_browser()
             
             # Initialize Blinkit adapter
             if not GROCERY_AVAILABLE:
                 self.message_queue.put(("output", "❌ Grocery adapter not available", "error"))
                 return
                 
-            wait = WebDriverWait(self.driver, 10)
-            adapter = BlinkitAdapter(self.driver, wait)
+            adapter = self._get_adapter('blinkit')
             
             # Setup location if provided
-            location = self.location_entry.get().strip()
+            location = self.location_var.get().strip()
             if location:
                 self.message_queue.put(("output", f"📍 Setting up location: {location}", "info"))
-                # Parse location - assume it's either pincode or "area, pincode"
-                if ',' in location:
-                    parts = [part.strip() for part in location.split(',')]
-                    if len(parts) >= 2:
-                        area = parts[0]
-                        pincode = parts[1]
-                    else:
-                        area = None
-                        pincode = location
-                else:
-                    area = None
-                    pincode = location
-                
-                location_result = adapter.setup_location(pincode, area)
+                location_result = self._setup_blinkit_location(adapter)
                 if not location_result:
                     self.message_queue.put(("output", "❌ Failed to setup location", "error"))
                     return
@@ -1071,12 +1679,11 @@ class AIVAGui:
             ordered_items = 0
             failed_items = 0
             
-            for i, item in enumerate(items, 1):
-                item_name = item['item_name']
-                quantity = item['quantity']
-                
+            for i, (item_name, quantity) in enumerate(items.items(), 1):
                 self.message_queue.put(("output", f"  🔍 [{i}/{len(items)}] Searching for {quantity}x {item_name}...", ""))
                 
+                # Result lines for this item are posted together once it is done
+                lines = []
                 try:
                     # Search for the product
                     products = adapter.search_product(item_name)
@@ -1084,43 +1691,44 @@ class AIVAGui:
                     if products:
                         # Take the first product (best match)
                         product = products[0]
-                        self.message_queue.put(("output", f"    ✅ Found: {product['name']} - ₹{product['price']}", ""))
+                        lines.append((f"    ✅ Found: {product['name']} - ₹{product['price']}", ""))
                         
                         # Try to add to cart
                         if 'element' in product:
                             cart_result = adapter.add_to_cart(product['element'], quantity)
                             if cart_result:
-                                self.message_queue.put(("output", f"    🛒 Added {quantity}x {product['name']} to cart", "success"))
+                                lines.append((f"    🛒 Added {quantity}x {product['name']} to cart", "success"))
                                 ordered_items += 1
                             else:
-                                self.message_queue.put(("output", f"    ⚠️ Could not add {item_name} to cart", "warning"))
+                                lines.append((f"    ⚠️ Could not add {item_name} to cart", "warning"))
                                 failed_items += 1
                         else:
-                            self.message_queue.put(("output", f"    ⚠️ No element available for {item_name}", "warning"))
+                            lines.append((f"    ⚠️ No element available for {item_name}", "warning"))
                             failed_items += 1
                     else:
-                        self.message_queue.put(("output", f"    ❌ Product '{item_name}' not found", "warning"))
+                        lines.append((f"    ❌ Product '{item_name}' not found", "warning"))
                         failed_items += 1
                     
-                    # Small delay between items
-                    time.sleep(2)
-                    
                 except Exception as e:
-                    self.message_queue.put(("output", f"    ❌ Error processing {item_name}: {str(e)}", "error"))
+                    lines.append((f"    ❌ Error processing {item_name}: {str(e)}", "error"))
                     failed_items += 1
-                    continue
+                
+                self._emit_batch(lines)
             
             # Summary
-            self.message_queue.put(("output", f"\n📊 ORDERING SUMMARY:", "header"))
-            self.message_queue.put(("output", f"  ✅ Successfully ordered: {ordered_items} items", "success"))
+            lines = [
+                (f"\n📊 ORDERING SUMMARY:", "header"),
+                (f"  ✅ Successfully ordered: {ordered_items} items", "success"),
+            ]
             if failed_items > 0:
-                self.message_queue.put(("output", f"  ❌ Failed to order: {failed_items} items", "warning"))
+                lines.append((f"  ❌ Failed to order: {failed_items} items", "warning"))
             
             if ordered_items > 0:
-                self.message_queue.put(("output", f"🛒 Items have been added to your Blinkit cart!", "success"))
-                self.message_queue.put(("output", f"💡 Click 'View Cart' to review and checkout", "info"))
+                lines.append((f"🛒 Items have been added to your Blinkit cart!", "success"))
+                lines.append((f"💡 Click 'View Cart' to review and checkout", "info"))
             else:
-                self.message_queue.put(("output", f"❌ No items were successfully added to cart", "error"))
+                lines.append((f"❌ No items were successfully added to cart", "error"))
+            self._emit_batch(lines)
             
         except Exception as e:
             self.message_queue.put(("output", f"❌ Ordering failed: {str(e)}", "error"))
@@ -1134,22 +1742,23 @@ class AIVAGui:
     def set_location(self):
         """Set delivery location."""
         
-        location = self.location_entry.get().strip()
+        location = self.location_var.get().strip()
         if location:
             self.add_output(f"📍 Location set to: {location}", "success")
             self.update_status(f"Location: {location}")
         else:
-            messagebox.showwarning("Warning", "Please enter a location.")
+            self._warn("Please enter a location.")
     
     def _initialize_microphone(self):
         """Initialize microphone with best available device."""
+        sr = _lazy_sr()
         try:
             # Try to find the best microphone
             mic_list = sr.Microphone.list_microphone_names()
             print(f"📡 Available microphones: {len(mic_list)}")
             
-            # Use default microphone with optimized settings
-            microphone = sr.Microphone()
+            # Use default microphone at 16 kHz (what the recognizer needs) with small read chunks
+            microphone = sr.Microphone(sample_rate=16000, chunk_size=1024)
             
             # Calibrate for ambient noise
             print("🎯 Calibrating microphone for ambient noise...")
@@ -1161,31 +1770,23 @@ class AIVAGui:
             
         except Exception as e:
             print(f"❌ Microphone initialization failed: {e}")
-            return sr.Microphone()  # Fallback to default
+            return sr.Microphone(sample_rate=16000, chunk_size=1024)  # Fallback to default
     
     def _initialize_tts_engine(self):
         """Initialize text-to-speech engine with optimized settings."""
+        pyttsx3 = _lazy_tts()
         try:
             engine = pyttsx3.init()
             
-            # Get available voices
-            voices = engine.getProperty('voices')
-            
             # Try to set a female voice if available
-            for voice in voices:
-                if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
-                    engine.setProperty('voice', voice.id)
-                    break
+            voice_id = self._select_tts_voice(engine)
+            if voice_id:
+                engine.setProperty('voice', voice_id)
             
             # Optimize speech settings
             engine.setProperty('rate', 160)     # Slower, clearer speech
             engine.setProperty('volume', 0.9)   # High volume
             
-            # Test TTS
-            print("🗣️ Testing text-to-speech...")
-            engine.say("Voice system ready")
-            engine.runAndWait()
-            
             return engine
             
         except Exception as e:
@@ -1195,62 +1796,107 @@ class AIVAGui:
             engine.setProperty('volume', 0.8)
             return engine
     
+    def _select_tts_voice(self, engine):
+        """Voice id to use, read from TTS_CACHE_FILE or found by scanning the installed voices."""
+        try:
+            with open(TTS_CACHE_FILE, 'rb') as f:
+                return _json_loads(f.read())['voice_id']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        voice_id = None
+        for voice in engine.getProperty('voices'):
+            name = voice.name.lower()
+            if 'female' in name or 'zira' in name:
+                voice_id = voice.id
+                break
+        
+        try:
+            os.makedirs(os.path.dirname(TTS_CACHE_FILE), exist_ok=True)
+            with open(TTS_CACHE_FILE, 'wb') as f:
+                f.write(_json_dumps({'voice_id': voice_id}))
+        except OSError as e:
+            print(f"⚠️ Could not cache TTS voice: {e}")
+        return voice_id
+    
+    def _prewarm_tts(self):
+        """Run one muted utterance so the speech driver is bound before the first real prompt."""
+        try:
+            # Engine commands run in order, so volume is restored once the muted utterance ends
+            volume = self.tts_engine.getProperty('volume')
+            self.tts_engine.setProperty('volume', 0.0)
+            self.tts_engine.say("ready")
+            self.tts_engine.setProperty('volume', volume)
+            self.tts_engine.runAndWait()
+        except Exception as e:
+            print(f"❌ TTS warm-up failed: {e}")
+    
+    def _tts_worker(self):
+        """Warm the speech driver, then speak queued utterances one at a time."""
+        self._prewarm_tts()
+        while True:
+            texts, done = self._tts_q.get()
+            try:
+                for text in texts:
+                    self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                print(f"❌ TTS error: {e}")
+            finally:
+                if done:
+                    done.set()
+    
     def _configure_voice_recognition(self):
         """Configure voice recognition parameters for better accuracy."""
         # Adjust recognition sensitivity
         self.recognizer.energy_threshold = 300      # Higher threshold for better noise filtering
         self.recognizer.dynamic_energy_threshold = True
-        self.recognizer.pause_threshold = 0.8       # Longer pause before considering speech ended
+        self.recognizer.pause_threshold = 0.5       # Short commands; end the phrase soon after speech stops
         self.recognizer.phrase_threshold = 0.3      # Minimum audio length to consider for phrase
-        self.recognizer.non_speaking_duration = 0.5 # Seconds of non-speaking audio before phrase completes
+        self.recognizer.non_speaking_duration = 0.3 # Seconds of non-speaking audio kept around a phrase
         
         print(f"🎙️ Voice recognition configured:")
         print(f"   • Energy threshold: {self.recognizer.energy_threshold}")
         print(f"   • Pause threshold: {self.recognizer.pause_threshold}s")
         print(f"   • Dynamic energy: {self.recognizer.dynamic_energy_threshold}")
     
-    def speak(self, text):
+    def speak(self, text, wait=False):
         """Enhanced text-to-speech with better error handling."""
+        self._speak_lines([text], wait)
+    
+    def _speak_lines(self, lines, wait=False):
+        """Queue lines to be spoken back to back; with wait, block until they have been spoken."""
         if not self.voice_enabled:
             return
             
         try:
             # Clean text for better speech
-            clean_text = self._clean_text_for_speech(text)
+            texts = [text for text in map(self._clean_text_for_speech, lines) if text]
+            if not texts:
+                return
             
-            # Speak in separate thread to avoid blocking
-            def speak_thread():
+            # Drop stale prompts rather than reading out a backlog, releasing anyone waiting on them
+            while self._tts_q.qsize() >= TTS_MAX_QUEUED:
                 try:
-                    self.tts_engine.say(clean_text)
-                    self.tts_engine.runAndWait()
-                except Exception as e:
-                    print(f"❌ TTS error: {e}")
+                    _, stale_done = self._tts_q.get_nowait()
+                except queue.Empty:
+                    break
+                if stale_done:
+                    stale_done.set()
             
-            thread = threading.Thread(target=speak_thread)
-            thread.daemon = True
-            thread.start()
+            done = threading.Event() if wait else None
+            self._tts_q.put((texts, done))
+            if done:
+                done.wait()
             
         except Exception as e:
             print(f"❌ Speech synthesis failed: {e}")
     
     def _clean_text_for_speech(self, text):
         """Clean text for better speech synthesis."""
-        # Remove emojis and special characters
-        clean_text = re.sub(r'[🤖🎤🔍🛒🥬📍✅❌⚠️💡📊🎯]', '', text)
-        
-        # Replace common abbreviations
-        replacements = {
-            'AIVA': 'Aiva',
-            'GUI': 'graphical user interface',
-            'API': 'A P I',
-            'URL': 'U R L',
-            'TTS': 'text to speech',
-            'AI': 'artificial intelligence'
-        }
-        
-        for old, new in replacements.items():
-            clean_text = clean_text.replace(old, new)
-        
+        # Remove emojis, then replace whole-word abbreviations in one pass
+        clean_text = _SPEECH_EMOJI_RE.sub('', text)
+        clean_text = _SPEECH_ABBR_RE.sub(lambda m: _SPEECH_ABBREVIATIONS[m[0]], clean_text)
         return clean_text.strip()
     
     def toggle_voice_mode(self):
@@ -1267,6 +1913,7 @@ class AIVAGui:
             # Stop listening
             self.is_listening = False
             self.voice_active = False
+            self._stop_voice_listener()
             self.add_output("🔇 Voice mode deactivated", "info")
             self.speak("Voice mode off")
             return
@@ -1277,239 +1924,181 @@ class AIVAGui:
         self.speak("Voice mode activated. How can I help you?")
         
         # Start voice recognition in thread
-        thread = threading.Thread(target=self.listen_for_voice_command)
-        thread.daemon = True
-        thread.start()
+        self._submit(self.listen_for_voice_command)
     
     def listen_for_voice_command(self):
-        """Enhanced voice listening with improved error handling and recovery."""
+        """Calibrate the microphone and start recognizing phrases in the background."""
         
         self.is_listening = True
-        retry_count = 0
-        max_retries = 3
+        self._voice_retries = 0
+        try:
+            # Ambient noise calibration once per session
+            with self.microphone as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+            
+            # speech_recognition captures on its own thread and calls back once per phrase
+            self._stop_listening = self.recognizer.listen_in_background(
+                self.microphone, self._on_voice_audio, phrase_time_limit=8)
+            self.message_queue.put(("status", "🎤 Listening..."))
+            
+        except OSError as e:
+            self.handle_voice_errors('microphone', str(e))
+            self.voice_active = False
+            self.is_listening = False
+            self.message_queue.put(("status", "Ready"))
+    
+    def _on_voice_audio(self, recognizer, audio):
+        """Recognize one captured phrase and run it; called on the listener thread."""
         
-        while self.voice_active and self.is_listening:
-            try:
-                self.message_queue.put(("status", "🎤 Listening..."))
-                
-                # Dynamic ambient noise adjustment
-                if retry_count == 0:
-                    with self.microphone as source:
-                        self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                
-                # Listen with timeout
-                with self.microphone as source:
-                    audio = self.recognizer.listen(source, timeout=15, phrase_time_limit=8)
-                
-                # Recognize speech
-                command = self.recognizer.recognize_google(audio, language='en-US').lower().strip()
-                
-                if command:
-                    self.message_queue.put(("output", f"👂 Heard: '{command}'", "info"))
-                    
-                    # Process command
-                    self._process_enhanced_voice_command(command)
-                    retry_count = 0  # Reset retry count on successful recognition
-                
-            except sr.WaitTimeoutError:
-                error_info = self.handle_voice_errors('timeout', 'Listening timeout')
-                retry_count += 1
-                
-            except sr.UnknownValueError:
-                error_info = self.handle_voice_errors('recognition', 'Could not understand speech')
-                retry_count += 1
-                
-            except sr.RequestError as e:
-                error_info = self.handle_voice_errors('network', str(e))
-                retry_count += 1
-                
-            except OSError as e:
-                error_info = self.handle_voice_errors('microphone', str(e))
-                retry_count += 1
-                
-            except Exception as e:
-                error_info = self.handle_voice_errors('unknown', str(e))
-                retry_count += 1
+        sr = _lazy_sr()
+        if not self.voice_active:
+            return
+        
+        try:
+            command = recognizer.recognize_google(audio, language='en-US').lower().strip()
             
-            # Check if too many retries
-            if retry_count >= max_retries:
-                self.message_queue.put(("output", "🔇 Too many errors, attempting recovery...", "error"))
+            if command:
+                self.message_queue.put(("output", f"👂 Heard: '{command}'", "info"))
+                self._voice_retries = 0  # Reset retry count on successful recognition
                 
-                # Attempt recovery
-                if self.recover_voice_session():
-                    retry_count = 0  # Reset if recovery successful
-                    continue
-                else:
-                    self.voice_active = False
-                    self.is_listening = False
-                    self.message_queue.put(("output", "❌ Voice mode stopped due to repeated errors", "error"))
-                    break
+                # Process command
+                self._process_enhanced_voice_command(command)
+            return
+            
+        except sr.UnknownValueError:
+            self.handle_voice_errors('recognition', 'Could not understand speech')
             
-            # Brief pause between listening attempts
-            time.sleep(0.5)
+        except sr.RequestError as e:
+            self.handle_voice_errors('network', str(e))
+            
+        except Exception as e:
+            self.handle_voice_errors('unknown', str(e))
+        
+        # Check if too many retries
+        self._voice_retries += 1
+        if self._voice_retries >= VOICE_MAX_RETRIES:
+            self.message_queue.put(("output", "🔇 Too many errors, attempting recovery...", "error"))
+            self._stop_voice_listener()
+            
+            # Attempt recovery with a fresh microphone and listener
+            if self.recover_voice_session():
+                self.listen_for_voice_command()
+            else:
+                self.voice_active = False
+                self.is_listening = False
+                self.message_queue.put(("output", "❌ Voice mode stopped due to repeated errors", "error"))
+    
+    def _stop_voice_listener(self):
+        """Stop the background listener without waiting for its thread."""
         
+        if self._stop_listening:
+            self._stop_listening(wait_for_stop=False)
+            self._stop_listening = None
         self.message_queue.put(("status", "Ready"))
-        self.is_listening = False
     
     def _process_enhanced_voice_command(self, command):
-        """Enhanced voice command processing with better natural language understanding."""
+        """Enhanced voice command processing; the command arrives lowercased and stripped from _on_voice_audio."""
         
-        command = command.lower().strip()
+        action, payload = _classify_voice_command(command)
         
         # Check for stop commands first
-        if any(word in command for word in ['stop', 'exit', 'quit', 'end']):
+        if action == 'stop':
             self.voice_active = False
             self.is_listening = False
+            self._stop_voice_listener()
             self.add_output("🔇 Voice mode stopped", "info")
             self.speak("Voice mode stopped")
-            return
         
         # Help commands
-        if any(word in command for word in ['help', 'what can you do', 'commands']):
+        elif action == 'help':
             self._provide_voice_help()
-            return
         
         # Search commands with intelligent parsing
-        if self._handle_search_commands(command):
-            return
+        elif action == 'search':
+            self._handle_search_commands(payload)
         
         # Shopping and e-commerce commands
-        if self._handle_shopping_commands(command):
-            return
+        elif action in ('platform', 'cart', 'purchase'):
+            self._handle_shopping_commands(action, payload)
         
         # Grocery commands
-        if self._handle_grocery_commands(command):
-            return
+        elif action in ('grocery_mode', 'location', 'grocery_order'):
+            self._handle_grocery_commands(action, payload)
         
         # Settings and configuration
-        if self._handle_settings_commands(command):
-            return
+        elif action in ('speech_rate', 'speech_volume', 'settings'):
+            self._handle_settings_commands(action, payload)
         
         # If no command matched, provide helpful feedback
-        self._handle_unknown_command(command)
+        else:
+            self._handle_unknown_command(command)
     
-    def _handle_search_commands(self, command):
+    def _handle_search_commands(self, query):
         """Handle search-related voice commands."""
-        search_triggers = ['search', 'find', 'look for', 'show me', 'get me']
-        
-        if any(trigger in command for trigger in search_triggers):
-            # Extract search query
-            query = self._extract_search_query(command)
+        if query:
+            # Set the query in the search box
+            self.search_entry.delete(0, tk.END)
+            self.search_entry.insert(0, query)
             
-            if query:
-                # Set the query in the search box
-                self.search_entry.delete(0, tk.END)
-                self.search_entry.insert(0, query)
-                
-                # Start search
-                self.add_output(f"🔍 Searching for: {query}", "info")
-                self.speak(f"Searching for {query}")
-                
-                # Start search in thread
-                thread = threading.Thread(target=self.start_search)
-                thread.daemon = True
-                thread.start()
-                
-                return True
-            else:
-                self.speak("What would you like me to search for?")
-                return True
-        
-        return False
+            # Start search
+            self.add_output(f"🔍 Searching for: {query}", "info")
+            self.speak(f"Searching for {query}")
+            
+            # Start search in thread
+            self._submit(self.start_search)
+        else:
+            self.speak("What would you like me to search for?")
     
-    def _handle_shopping_commands(self, command):
+    def _handle_shopping_commands(self, action, payload):
         """Handle shopping and e-commerce commands."""
-        shopping_keywords = ['buy', 'purchase', 'order', 'cart', 'checkout', 'flipkart', 'amazon']
-        
-        if any(keyword in command for keyword in shopping_keywords):
-            
-            # Platform selection
-            if 'flipkart' in command:
-                self.platform_var.set('flipkart')
-                self.add_output("🛒 Switched to Flipkart", "info")
-                self.speak("Switched to Flipkart")
-                return True
-                
-            elif 'amazon' in command:
-                self.platform_var.set('amazon')
-                self.add_output("🛒 Switched to Amazon", "info")  
-                self.speak("Switched to Amazon")
-                return True
-            
-            # Cart operations
-            elif any(word in command for word in ['cart', 'basket', 'checkout']):
-                self.add_output("🛒 Cart functionality via voice coming soon!", "info")
-                self.speak("Cart functionality via voice will be available soon")
-                return True
-            
-            # General purchase intent
-            elif any(word in command for word in ['buy', 'purchase', 'order']):
-                # Extract product name
-                product = self._extract_product_from_command(command)
-                if product:
-                    self.search_entry.delete(0, tk.END)
-                    self.search_entry.insert(0, product)
-                    self.add_output(f"🛒 Ready to shop for: {product}", "info")
-                    self.speak(f"Ready to shop for {product}. Say search to begin.")
-                else:
-                    self.speak("What would you like to buy?")
-                return True
-        
-        return False
+        # Platform selection
+        if action == 'platform':
+            self.platform_var.set(payload)
+            self.add_output(f"🛒 Switched to {payload.title()}", "info")
+            self.speak(f"Switched to {payload.title()}")
+        
+        # Cart operations
+        elif action == 'cart':
+            self.add_output("🛒 Cart functionality via voice coming soon!", "info")
+            self.speak("Cart functionality via voice will be available soon")
+        
+        # General purchase intent
+        elif payload:
+            self.search_entry.delete(0, tk.END)
+            self.search_entry.insert(0, payload)
+            self.add_output(f"🛒 Ready to shop for: {payload}", "info")
+            self.speak(f"Ready to shop for {payload}. Say search to begin.")
+        else:
+            self.speak("What would you like to buy?")
     
-    def _handle_grocery_commands(self, command):
+    def _handle_grocery_commands(self, action, payload):
         """Handle grocery ordering commands."""
-        grocery_keywords = ['grocery', 'groceries', 'food', 'blinkit', 'deliver', 'order food']
+        # Switch to grocery mode
+        if action == 'grocery_mode':
+            self.add_output("🥬 Switched to grocery ordering mode", "info")
+            self.speak("Switched to grocery mode. You can set your location and start ordering.")
         
-        if any(keyword in command for keyword in grocery_keywords):
-            
-            # Switch to grocery mode
-            if 'blinkit' in command or 'grocery' in command or 'groceries' in command:
-                self.add_output("🥬 Switched to grocery ordering mode", "info")
-                self.speak("Switched to grocery mode. You can set your location and start ordering.")
-                return True
-            
-            # Location setting
-            elif 'location' in command or 'address' in command:
-                self.speak("Please enter your location or pincode manually, or say a specific location")
-                return True
-            
-            # Order specific items
-            elif 'order' in command:
-                item = self._extract_grocery_item(command)
-                if item:
-                    self.add_output(f"🥬 Adding {item} to grocery search", "info")
-                    self.speak(f"Adding {item} to your grocery list")
-                else:
-                    self.speak("What grocery items would you like to order?")
-                return True
+        # Location setting
+        elif action == 'location':
+            self.speak("Please enter your location or pincode manually, or say a specific location")
         
-        return False
+        # Order specific items
+        elif payload:
+            self.add_output(f"🥬 Adding {payload} to grocery search", "info")
+            self.speak(f"Adding {payload} to your grocery list")
+        else:
+            self.speak("What grocery items would you like to order?")
     
-    def _handle_settings_commands(self, command):
+    def _handle_settings_commands(self, action, payload):
         """Handle settings and configuration commands."""
-        settings_keywords = ['settings', 'config', 'setup', 'change']
-        
-        if any(keyword in command for keyword in settings_keywords):
-            
-            if 'voice' in command:
-                if 'faster' in command or 'speed up' in command:
-                    self._adjust_speech_rate(1.2)
-                    return True
-                elif 'slower' in command or 'slow down' in command:
-                    self._adjust_speech_rate(0.8)
-                    return True
-                elif 'volume' in command:
-                    if 'up' in command or 'louder' in command:
-                        self._adjust_speech_volume(1.0)
-                    elif 'down' in command or 'quieter' in command:
-                        self._adjust_speech_volume(0.6)
-                    return True
-            
+        if action == 'speech_rate':
+            self._adjust_speech_rate(payload)
+        elif action == 'speech_volume':
+            # "voice volume" without up or down leaves the volume alone
+            if payload is not None:
+                self._adjust_speech_volume(payload)
+        else:
             self.speak("Settings can be adjusted manually in the interface")
-            return True
-        
-        return False
     
     def _handle_unknown_command(self, command):
         """Handle unrecognized commands with helpful suggestions."""
@@ -1527,54 +2116,6 @@ class AIVAGui:
         self.add_output(f"💡 {suggestion}", "info")
         self.speak(f"I didn't understand that. {suggestion}")
     
-    def _extract_search_query(self, command):
-        """Extract search query from voice command."""
-        # Remove trigger words
-        triggers = ['search for', 'find', 'look for', 'show me', 'get me', 'search']
-        
-        query = command
-        for trigger in triggers:
-            query = query.replace(trigger, '')
-        
-        # Clean up the query
-        query = query.strip()
-        
-        # Remove common stop words at the beginning/end
-        stop_words = ['a', 'an', 'the', 'some', 'any']
-        words = query.split()
-        
-        # Remove stop words from beginning
-        while words and words[0] in stop_words:
-            words.pop(0)
-        
-        # Remove stop words from end
-        while words and words[-1] in stop_words:
-            words.pop()
-        
-        return ' '.join(words)
-    
-    def _extract_product_from_command(self, command):
-        """Extract product name from shopping commands."""
-        # Remove shopping trigger words
-        triggers = ['buy', 'purchase', 'order', 'get me', 'i want', 'i need']
-        
-        product = command
-        for trigger in triggers:
-            product = product.replace(trigger, '')
-        
-        return product.strip()
-    
-    def _extract_grocery_item(self, command):
-        """Extract grocery item from command."""
-        # Remove grocery trigger words
-        triggers = ['order', 'get', 'buy', 'add', 'i need', 'i want']
-        
-        item = command
-        for trigger in triggers:
-            item = item.replace(trigger, '')
-        
-        return item.strip()
-    
     def _adjust_speech_rate(self, factor):
         """Adjust speech rate."""
         try:
@@ -1582,7 +2123,7 @@ class AIVAGui:
             new_rate = int(current_rate * factor)
             self.tts_engine.setProperty('rate', new_rate)
             self.speak(f"Speech rate adjusted to {new_rate}")
-        except:
+        except Exception:
             self.speak("Could not adjust speech rate")
     
     def _adjust_speech_volume(self, volume):
@@ -1590,7 +2131,7 @@ class AIVAGui:
         try:
             self.tts_engine.setProperty('volume', volume)
             self.speak("Speech volume adjusted")
-        except:
+        except Exception:
             self.speak("Could not adjust speech volume")
     
     def _provide_voice_help(self):
@@ -1608,16 +2149,14 @@ class AIVAGui:
         for cmd in help_commands:
             self.add_output(f"   • {cmd}", "info")
         
-        # Interactive voice tutorial
-        self.speak("Here are the main voice commands you can use.")
-        time.sleep(1)
-        self.speak("For searching, say search for followed by what you want to find.")
-        time.sleep(1) 
-        self.speak("To switch platforms, say switch to Amazon or switch to Flipkart.")
-        time.sleep(1)
-        self.speak("For groceries, say grocery mode or order specific items.")
-        time.sleep(1)
-        self.speak("Say stop anytime to exit voice mode. What would you like to do?")
+        # Interactive voice tutorial, spoken back to back as one utterance
+        self._speak_lines([
+            "Here are the main voice commands you can use.",
+            "For searching, say search for followed by what you want to find.",
+            "To switch platforms, say switch to Amazon or switch to Flipkart.",
+            "For groceries, say grocery mode or order specific items.",
+            "Say stop anytime to exit voice mode. What would you like to do?",
+        ])
     
     def start_voice_tutorial(self):
         """Start an interactive voice tutorial for new users."""
@@ -1629,64 +2168,31 @@ class AIVAGui:
         
         def tutorial_thread():
             try:
-                self.speak("Welcome to AIVA voice tutorial!")
-                time.sleep(2)
+                self._speak_lines([
+                    "Welcome to AIVA voice tutorial!",
+                    "I'll teach you how to use voice commands. First, try saying hello to me.",
+                ])
                 
-                self.speak("I'll teach you how to use voice commands. First, try saying hello to me.")
-                # Wait for user response
-                tutorial_step = 1
+                # Each prompt is followed by time for the user to try it, counted from when it was spoken
+                for prompt in ("Now try saying: search for laptop", "Good! Now try: switch to Amazon"):
+                    self.speak(prompt, wait=True)
+                    time.sleep(TUTORIAL_TRY_SECONDS)
                 
-                while tutorial_step <= 3:
-                    if tutorial_step == 1:
-                        self.speak("Now try saying: search for laptop")
-                        # Tutorial continues...
-                    elif tutorial_step == 2:
-                        self.speak("Good! Now try: switch to Amazon")
-                    elif tutorial_step == 3:
-                        self.speak("Excellent! Voice tutorial complete. You're ready to use AIVA!")
-                        break
-                    
-                    tutorial_step += 1
-                    time.sleep(5)  # Wait for user to try command
+                self.speak("Excellent! Voice tutorial complete. You're ready to use AIVA!")
                     
             except Exception as e:
                 self.message_queue.put(("output", f"❌ Tutorial error: {e}", "error"))
         
-        thread = threading.Thread(target=tutorial_thread)
-        thread.daemon = True
-        thread.start()
+        self._submit(tutorial_thread)
     
     def handle_voice_errors(self, error_type, error_msg):
         """Enhanced voice error handling with recovery suggestions."""
         
-        error_responses = {
-            'timeout': {
-                'message': "⏰ Voice timeout - I didn't hear anything",
-                'speech': "I didn't hear you. Please try speaking again, or say stop to exit voice mode.",
-                'suggestion': "💡 Speak clearly and ensure your microphone is working"
-            },
-            'recognition': {
-                'message': "❓ Could not understand what you said",
-                'speech': "I couldn't understand that. Please speak clearly and try again.",
-                'suggestion': "💡 Try speaking slower or rephrasing your command"
-            },
-            'network': {
-                'message': "🌐 Network error - speech recognition service unavailable",
-                'speech': "Network error. Speech recognition is temporarily unavailable.",
-                'suggestion': "💡 Check your internet connection and try again"
-            },
-            'microphone': {
-                'message': "🎤 Microphone error - check your audio input",
-                'speech': "Microphone error. Please check your audio settings.",
-                'suggestion': "💡 Ensure your microphone is connected and not muted"
-            }
-        }
-        
-        error_info = error_responses.get(error_type, {
+        error_info = self._ERROR_RESPONSES.get(error_type) or {
             'message': f"❌ Voice error: {error_msg}",
             'speech': "An error occurred with voice recognition.",
             'suggestion': "💡 Try restarting voice mode"
-        })
+        }
         
         # Display error message
         self.add_output(error_info['message'], "error")
@@ -1696,7 +2202,7 @@ class AIVAGui:
         if self.voice_enabled and error_type != 'microphone':
             try:
                 self.speak(error_info['speech'])
-            except:
+            except Exception:
                 pass  # Don't compound errors
         
         return error_info
@@ -1770,8 +2276,8 @@ class AIVAGui:
         """Refresh the interface."""
         
         # Update grocery list combo
-        lists = list(self.grocery_manager.get_all_lists().keys())
-        self.list_combo['values'] = lists
+        if self.list_combo is not None:
+            self.list_combo['values'] = self._list_names()
         
         self.add_output("🔄 Interface refreshed.", "info")
     
@@ -1785,44 +2291,64 @@ class AIVAGui:
         """Save user settings."""
         
         settings = {
-            'location': self.location_entry.get(),
+            'location': self.location_var.get(),
             'last_service': self.current_service,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': _iso_timestamp(int(time.time()))
         }
         
         try:
-            with open('aiva_settings.json', 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Write a temp file and swap it in so a crash never leaves a half-written file
+            tmp_file = SETTINGS_FILE + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(settings))
+            os.replace(tmp_file, SETTINGS_FILE)
+            self._settings_cache = settings
+            self._settings_mtime = os.stat(SETTINGS_FILE).st_mtime_ns
             self.add_output("💾 Settings saved successfully.", "success")
         except Exception as e:
             self.add_output(f"❌ Failed to save settings: {str(e)}", "error")
     
     def load_settings(self):
-        """Load user settings."""
+        """Load user settings in the background and apply them on the GUI thread."""
+        
+        self._submit(self._load_settings_bg)
+    
+    def _load_settings_bg(self):
+        """Read the settings file, reusing the last parse while its mtime is unchanged."""
         
         try:
-            if os.path.exists('aiva_settings.json'):
-                with open('aiva_settings.json', 'r') as f:
-                    settings = json.load(f)
-                
-                # Load location
-                location = settings.get('location', '')
-                self.location_entry.insert(0, location)
-                
-                # Load last service
-                last_service = settings.get('last_service')
-                if last_service:
-                    self.select_service(last_service)
-                
-                self.add_output("📂 Settings loaded successfully.", "info")
+            mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return
+        
+        try:
+            if mtime != self._settings_mtime:
+                with open(SETTINGS_FILE, 'rb') as f:
+                    self._settings_cache = _json_loads(f.read())
+                self._settings_mtime = mtime
+            self.message_queue.put(("settings", self._settings_cache))
         except Exception as e:
-            self.add_output(f"⚠️ Could not load settings: {str(e)}", "warning")
+            self.message_queue.put(("output", f"⚠️ Could not load settings: {str(e)}", "warning"))
+    
+    def _apply_settings(self, settings):
+        """Apply loaded settings to the interface."""
+        
+        # Load location
+        location = settings.get('location', '')
+        self.location_var.set(location)
+        
+        # Load last service
+        last_service = settings.get('last_service')
+        if last_service:
+            self.select_service(last_service)
+        
+        self.add_output("📂 Settings loaded successfully.", "info")
     
     def add_output(self, text, tag="", speak=False):
         """Enhanced add text to output panel with optional formatting and voice feedback."""
         
         def _add():
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = _timestamp(int(time.time()))
             formatted_text = f"[{timestamp}] {text}\n"
             
             if tag:
@@ -1830,6 +2356,7 @@ class AIVAGui:
             else:
                 self.output_text.insert(tk.END, formatted_text)
             
+            self._trim_output()
             self.output_text.see(tk.END)
             
             # Auto-speak important messages if voice is active
@@ -1843,21 +2370,9 @@ class AIVAGui:
     
     def _should_auto_speak(self, text, tag):
         """Determine if a message should be automatically spoken."""
-        # Speak important status updates
-        if tag in ["success", "error", "warning"]:
-            return True
-        
-        # Speak search results and completion messages
-        if any(keyword in text.lower() for keyword in 
-               ["found", "completed", "ready", "failed", "error", "success"]):
-            return True
-        
-        # Don't speak routine log messages
-        if any(keyword in text.lower() for keyword in 
-               ["loading", "processing", "analyzing", "waiting"]):
-            return False
-        
-        return False
+        # Speak important status updates and search results or completion messages;
+        # routine log messages ("loading", "processing", ...) are not spoken
+        return tag in _AUTO_SPEAK_TAGS or _AUTO_SPEAK_RE.search(text) is not None
     
     def update_status(self, text):
         """Update status bar."""
@@ -1873,68 +2388,104 @@ class AIVAGui:
     def process_messages(self):
         """Process messages from worker threads."""
         
-        try:
-            while True:
-                msg_data = self.message_queue.get_nowait()
-                msg_type = msg_data[0]
-                data = msg_data[1:]
-                
-                if msg_type == "output":
+        # Output lines are collected as (text, tag, text, tag, ...) and written
+        # with a single Text.insert after the drain
+        output_chunks = []
+        
+        for msg_data in self.message_queue.drain(MESSAGE_BATCH_LIMIT):
+            msg_type = msg_data[0]
+            data = msg_data[1:]
+            
+            if msg_type in ("output", "output_batch"):
+                if msg_type == "output_batch":
+                    lines = [(text, tag, False) for text, tag in data[0]]
+                elif len(data) == 2:
                     # Handle both old and new message formats
-                    if len(data) == 2:
-                        text, tag = data
-                        speak = False
-                    else:
-                        text, tag, speak = data
-                    
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    formatted_text = f"[{timestamp}] {text}\n"
-                    
-                    if tag:
-                        self.output_text.insert(tk.END, formatted_text, tag)
-                    else:
-                        self.output_text.insert(tk.END, formatted_text)
-                    
-                    self.output_text.see(tk.END)
+                    lines = [(*data, False)]
+                else:
+                    lines = [data]
+                
+                timestamp = _timestamp(int(time.time()))
+                for text, tag, speak in lines:
+                    output_chunks.append(f"[{timestamp}] {text}\n")
+                    output_chunks.append(tag)
                     
                     # Voice feedback for important messages
                     if self.voice_active and (speak or self._should_auto_speak(text, tag)):
                         self.speak(text)
+            
+            elif msg_type == "status":
+                status_text = data[0]
+                self.status_label.config(text=status_text)
                 
-                elif msg_type == "status":
-                    status_text = data[0]
-                    self.status_label.config(text=status_text)
-                    
-                    # Voice feedback for status changes during voice mode
-                    if self.voice_active and any(keyword in status_text.lower() for keyword in 
-                                               ["ready", "completed", "error", "failed"]):
-                        self.speak(status_text)
-                
-                elif msg_type == "progress":
-                    if data[0] == "start":
-                        self.progress.start()
-                    else:
-                        self.progress.stop()
-                
-                elif msg_type == "session_status":
-                    self.session_status_label.config(text=data[0])
-                
-                elif msg_type == "update_products":
+                # Voice feedback for status changes during voice mode
+                if self.voice_active and _AUTO_SPEAK_STATUS_RE.search(status_text):
+                    self.speak(status_text)
+            
+            elif msg_type == "progress":
+                if data[0] == "start":
+                    self.progress.start()
+                else:
+                    self.progress.stop()
+            
+            elif msg_type == "session_status":
+                self.session_status_label.config(text=data[0])
+            
+            elif msg_type == "settings":
+                self._apply_settings(data[0])
+            
+            elif msg_type == "warn":
+                self._warn(data[0])
+            
+            elif msg_type == "update_products":
+                # Skip the values write (and redraw) when the options are unchanged
+                if data[0] != self._product_options:
+                    self._product_options = data[0]
                     self.product_combo['values'] = data[0]
-                    if data[0]:  # If there are products, select the first one
-                        self.product_combo.current(0)
+                if data[0]:  # If there are products, select the first one
+                    self.product_combo.current(0)
         
-        except queue.Empty:
-            pass
+        if output_chunks:
+            self.output_text.insert(tk.END, *output_chunks)
+            self._trim_output()
+            self.output_text.see(tk.END)
         
-        # Schedule next check
-        self.root.after(100, self.process_messages)
+        # Yield to input and redraws before handling the rest of a burst
+        if self.message_queue.pending():
+            self.root.after(0, self.process_messages)
+    
+    def _message_fallback_poll(self):
+        """Once a second, drain messages whose wakeup event was lost (e.g. posted before mainloop started)."""
+        if self.message_queue.pending():
+            self.process_messages()
+        self.root.after(1000, self._message_fallback_poll)
+    
+    def _trim_output(self):
+        """Drop the oldest output lines beyond OUTPUT_MAX_LINES in a single delete."""
+        # "end-1c" is on the empty line after the final newline
+        excess = int(self.output_text.index("end-1c").split(".")[0]) - 1 - OUTPUT_MAX_LINES
+        if excess > 0:
+            self.output_text.delete("1.0", f"{excess + 1}.0")
     
     def on_closing(self):
         """Handle application closing."""
         
-        if self.driver:
-            self.driver.quit()
+        # Waits out a browser start in progress (e.g. the startup prewarm) so its Chrome is quit too
+        self._closing = True
+        with self._browser_lock:
+            if self.driver:
+                self.driver.quit()
+                self.driver = None
+        
+        # Drop queued work that has not started; running tasks finish on their own
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        self._pool.shutdown(wait=False)
+        self._workers.shutdown(wait=False)
+        for driver in self._drivers.values():
+            driver.quit()
         
         self.save_settings()
         self.root.destroy()
@@ -1942,9 +2493,10 @@ class AIVAGui:
 class GroceryManagerWindow:
     """Separate window for grocery list management."""
     
-    def __init__(self, parent, grocery_manager, message_queue):
+    def __init__(self, parent, grocery_manager, message_queue, on_lists_changed=None):
         self.grocery_manager = grocery_manager
         self.message_queue = message_queue
+        self.on_lists_changed = on_lists_changed
         
         # Create window
         self.window = tk.Toplevel(parent)
@@ -1994,22 +2546,24 @@ class GroceryManagerWindow:
         
         all_lists = self.grocery_manager.get_all_lists()
         
+        # Collected as (text, tag, text, tag, ...) and written with a single insert
+        chunks = []
         for list_name, list_data in all_lists.items():
             items = list_data['items']
             cost = self.grocery_manager.get_estimated_cost(list_name)
             
-            self.list_text.insert(tk.END, f"📋 {list_name.upper()}\n", "header")
-            self.list_text.insert(tk.END, f"Items: {len(items)} | Cost: ₹{cost:.2f}\n")
-            self.list_text.insert(tk.END, "-" * 50 + "\n")
-            
+            lines = [f"Items: {len(items)} | Cost: ₹{cost:.2f}", "-" * 50]
             for item in items:
                 item_name = item['item_name']
                 quantity = item['quantity']
                 notes = item.get('notes', '')
                 notes_text = f" ({notes})" if notes else ""
-                self.list_text.insert(tk.END, f"  • {quantity}x {item_name}{notes_text}\n")
+                lines.append(f"  • {quantity}x {item_name}{notes_text}")
             
-            self.list_text.insert(tk.END, "\n")
+            chunks += [f"📋 {list_name.upper()}\n", "header", "\n".join(lines) + "\n\n", ""]
+        
+        if chunks:
+            self.list_text.insert(tk.END, *chunks)
     
     def create_new_list(self):
         """Create a new grocery list."""
@@ -2020,6 +2574,8 @@ class GroceryManagerWindow:
             if self.grocery_manager.create_list(list_name):
                 messagebox.showinfo("Success", f"Created list: {list_name}")
                 self.display_all_lists()
+                if self.on_lists_changed:
+                    self.on_lists_changed()
             else:
                 messagebox.showerror("Error", "Failed to create list")
 
@@ -4,23 +4,116 @@ asr.py: Minimal ASR (Automatic Speech Recognition) module for AIVA
 - Provides get_text_input() and get_voice_input() functions
 - get_command() chooses best available (voice, else text)
 """
+import os
 import logging
+import threading
+import concurrent.futures
+from functools import lru_cache
 from typing import Optional
 
+# Longest single command captured, in seconds; recognition starts as soon as it ends
+PHRASE_TIME_LIMIT = 8
+
+# Local Whisper on a CUDA device is opt-in (set AIVA_LOCAL_WHISPER=1); loading torch and the model takes seconds
+LOCAL_WHISPER = os.environ.get("AIVA_LOCAL_WHISPER") == "1"
+WHISPER_MODEL = "openai/whisper-tiny"
+
 def get_text_input(prompt: str = "Type your command: ") -> str:
     return input(prompt)
 
+@lru_cache(maxsize=1)
+def _recognizer():
+    """Shared recognizer tuned for short commands, so the phrase is sent soon after speech stops."""
+    import speech_recognition as sr
+    r = sr.Recognizer()
+    r.pause_threshold = 0.5
+    r.non_speaking_duration = 0.3
+    return r
+
+def _load_whisper_pipeline():
+    """Whisper in fp16 on the GPU; None when CUDA or the model is unavailable."""
+    try:
+        import torch
+        from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
+    except Exception as e:
+        logging.warning(f"Local Whisper unavailable: {e}")
+        return None
+    if not torch.cuda.is_available():
+        return None
+    try:
+        model = AutoModelForSpeechSeq2Seq.from_pretrained(
+            WHISPER_MODEL, torch_dtype=torch.float16, low_cpu_mem_usage=True, use_safetensors=True
+        ).to("cuda")
+        processor = AutoProcessor.from_pretrained(WHISPER_MODEL)
+        return pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            torch_dtype=torch.float16,
+            device="cuda",
+            chunk_length_s=10,
+        )
+    except Exception as e:
+        logging.warning(f"Local Whisper unavailable: {e}")
+        return None
+
+# Pipeline loaded by warm_local_asr(); resolves to None when Whisper cannot run here
+_whisper_future: Optional[concurrent.futures.Future] = None
+_whisper_lock = threading.Lock()
+
+def warm_local_asr() -> None:
+    """Start loading local Whisper in the background when enabled, so no command waits for it."""
+    global _whisper_future
+    if not LOCAL_WHISPER:
+        return
+    with _whisper_lock:
+        if _whisper_future is None:
+            future = _whisper_future = concurrent.futures.Future()
+            threading.Thread(target=lambda: future.set_result(_load_whisper_pipeline()), daemon=True).start()
+
+def _whisper_pipeline():
+    """The loaded pipeline, or None while disabled, still loading or unavailable."""
+    future = _whisper_future
+    if future is None or not future.done():
+        return None
+    return future.result()
+
+def get_voice_input_local(audio_array, sampling_rate: int = 16000) -> Optional[str]:
+    """Transcribes a mono float32 array in [-1, 1] with local Whisper; None when it is not ready."""
+    asr = _whisper_pipeline()
+    if asr is None:
+        return None
+    import numpy as np
+    y = np.asarray(audio_array, dtype=np.float32)
+    if not y.size:
+        return None
+    text = asr({"raw": y, "sampling_rate": sampling_rate})["text"].strip()
+    return text or None
+
+def _audio_to_array(audio):
+    """16 kHz mono float32 samples in [-1, 1] from a SpeechRecognition AudioData."""
+    import numpy as np
+    raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
 def get_voice_input(timeout: int = 5) -> Optional[str]:
     try:
         import speech_recognition as sr
     except ImportError:
         logging.warning("SpeechRecognition not installed. Falling back to text input.")
         return None
-    r = sr.Recognizer()
+    warm_local_asr()  # No-op when disabled or already started
+    r = _recognizer()
     try:
-        with sr.Microphone() as source:
+        with sr.Microphone(sample_rate=16000) as source:
             print("🎙 Listening... Speak now")
-            audio = r.listen(source, timeout=timeout)
+            audio = r.listen(source, timeout=timeout, phrase_time_limit=PHRASE_TIME_LIMIT)
+        # Transcribe on the GPU once local Whisper has loaded; Google covers everything else
+        if _whisper_pipeline() is not None:
+            text = get_voice_input_local(_audio_to_array(audio))
+            if text:
+                return text
         try:
             text = r.recognize_google(audio)
             return text
@@ -42,5 +135,6 @@ def get_command() -> str:
 
 if __name__ == "__main__":
     print("AIVA ASR Demo: Speak or type a command.")
+    warm_local_asr()  # Whisper loads while the demo waits for the first command
     cmd = get_command()
     print(f"Command received: {cmd}")
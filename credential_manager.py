@@ -9,40 +9,102 @@ import base64
 import time
 from typing import Optional, Dict
 
+# orjson is optional; credentials are stored as raw JSON bytes with either backend
+try:
+    import orjson
+    
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
+# cryptography is optional; without it credentials keep the older base64 wrapping
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+except ImportError:
+    ChaCha20Poly1305 = None
+
+# ChaCha20-Poly1305 nonce length in bytes; the nonce is stored ahead of the ciphertext
+NONCE_SIZE = 12
+
 class CredentialManager:
     """Secure credential management for AIVA login system."""
     
     def __init__(self, credentials_file: str = ".aiva_credentials"):
         """Initialize credential manager."""
         self.credentials_file = credentials_file
-    
-    def _encode(self, data: str) -> str:
-        """Simple encoding for security."""
-        try:
-            encoded = base64.b64encode(data.encode()).decode()
-            return encoded
-        except:
-            return ""
+        # Random key generated on first save, readable only by the owner
+        self.key_file = credentials_file + ".key"
+        self._aead = None
+        # Decoded credentials and the file (mtime, size) they were read at
+        self._cache = None
+        self._cache_key = None
     
     def _decode(self, data: str) -> str:
-        """Simple decoding."""
+        """Decode a base64 field from the legacy credentials format."""
         try:
             decoded = base64.b64decode(data.encode()).decode()
             return decoded
         except:
             return ""
     
+    def _cipher(self, create: bool = False):
+        """AEAD cipher using the key file, or None when cryptography or the key is missing."""
+        if ChaCha20Poly1305 is None:
+            return None
+        if self._aead is None:
+            try:
+                with open(self.key_file, 'rb') as f:
+                    key = f.read()
+            except FileNotFoundError:
+                if not create:
+                    return None
+                key = ChaCha20Poly1305.generate_key()
+                fd = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(key)
+            self._aead = ChaCha20Poly1305(key)
+        return self._aead
+    
+    def _write(self, credentials: Dict) -> None:
+        """Write credentials (encrypted when possible) and drop the cached copy."""
+        payload = _json_dumps(credentials)
+        cipher = self._cipher(create=True)
+        if cipher is not None:
+            nonce = os.urandom(NONCE_SIZE)
+            payload = nonce + cipher.encrypt(nonce, payload, None)
+        else:
+            payload = base64.b64encode(payload)
+        # Owner-only, including a file left behind by an older version with default permissions
+        fd = os.open(self.credentials_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(self.credentials_file, 0o600)
+        self._cache_key = None
+    
+    def _decrypt(self, content: bytes) -> Optional[Dict]:
+        """Decrypt a nonce-prefixed payload; None for base64 or legacy files."""
+        if len(content) <= NONCE_SIZE:
+            return None
+        try:
+            cipher = self._cipher()
+            if cipher is None:
+                return None
+            return _json_loads(cipher.decrypt(content[:NONCE_SIZE], content[NONCE_SIZE:], None))
+        except Exception:
+            return None
+    
     def save_credentials(self, email: str, password: str) -> bool:
-        """Save credentials with simple encoding (legacy method)."""
+        """Save email/password credentials (legacy method)."""
         try:
-            credentials = {
-                "email": self._encode(email),
-                "password": self._encode(password),
-                "saved": True
-            }
-            
-            with open(self.credentials_file, 'w') as f:
-                json.dump(credentials, f)
+            self._write({
+                "username": email,
+                "password": password,
+                "login_type": "traditional"
+            })
             
             print("✅ Credentials saved securely")
             return True
@@ -59,11 +121,7 @@ class CredentialManager:
                 "login_type": "otp",
                 "saved_at": time.time()
             }
-            
-            encoded_creds = base64.b64encode(json.dumps(credentials).encode()).decode()
-            
-            with open(self.credentials_file, 'w') as f:
-                f.write(encoded_creds)
+            self._write(credentials)
             
             print(f"✅ Email/mobile saved securely for OTP login")
             return True
@@ -75,42 +133,50 @@ class CredentialManager:
     def load_credentials(self) -> Optional[Dict[str, str]]:
         """Load saved credentials - supports both old and new formats."""
         try:
-            if not os.path.exists(self.credentials_file):
-                return None
-            
-            with open(self.credentials_file, 'r') as f:
-                content = f.read().strip()
+            stat = os.stat(self.credentials_file)
+        except OSError:
+            return None
+        
+        # Re-read only when the file changed since the last load
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key != self._cache_key:
+            self._cache = self._read_credentials()
+            self._cache_key = key
+        return self._cache
+    
+    def _read_credentials(self) -> Optional[Dict[str, str]]:
+        """Parse the credentials file, falling back to the legacy formats."""
+        try:
+            with open(self.credentials_file, 'rb') as f:
+                content = f.read()
             
-            if not content:
+            if not content.strip():
                 return None
             
-            # Try new base64 format first
-            try:
-                decoded_data = base64.b64decode(content).decode()
-                credentials = json.loads(decoded_data)
-                
-                # Normalize to standard format
-                if "username" in credentials:
-                    return {
-                        "username": credentials["username"],
-                        "password": credentials.get("password", "otp_required"),
-                        "login_type": credentials.get("login_type", "otp")
-                    }
-                    
-            except Exception:
-                pass
+            data = self._decrypt(content)
+            if data is None:
+                content = content.strip()
+                if content.startswith(b'{'):
+                    data = _json_loads(content)
+                else:
+                    # Base64-wrapped JSON, written when cryptography is missing and by older versions
+                    data = json.loads(base64.b64decode(content))
             
-            # Try old JSON format
-            try:
-                data = json.loads(content)
-                if data.get("saved"):
-                    return {
-                        "username": self._decode(data["email"]),
-                        "password": self._decode(data["password"]),
-                        "login_type": "traditional"
-                    }
-            except Exception:
-                pass
+            # Normalize to standard format
+            if "username" in data:
+                return {
+                    "username": data["username"],
+                    "password": data.get("password", "otp_required"),
+                    "login_type": data.get("login_type", "otp")
+                }
+            
+            # Legacy JSON with base64-encoded fields from older save_credentials
+            if data.get("saved"):
+                return {
+                    "username": self._decode(data["email"]),
+                    "password": self._decode(data["password"]),
+                    "login_type": "traditional"
+                }
             
             return None
             
@@ -131,6 +197,7 @@ class CredentialManager:
         try:
             if os.path.exists(self.credentials_file):
                 os.remove(self.credentials_file)
+                self._cache_key = None
                 print("✅ Credentials deleted")
             return True
         except Exception as e:
@@ -141,9 +208,9 @@ class CredentialManager:
         """Get user choice for credential handling with OTP awareness."""
         print("\n🔐 Login Options:")
         
-        if self.has_saved_credentials():
-            saved_creds = self.load_credentials()
-            is_otp_account = saved_creds and saved_creds.get("password") == "otp_required"
+        saved_creds = self.load_credentials()
+        if saved_creds is not None:
+            is_otp_account = saved_creds.get("password") == "otp_required"
             
             if is_otp_account:
                 print("1. 📱 Use saved email/mobile (Assisted OTP login)")
@@ -6,11 +6,41 @@ executor.py: Minimal Execution Layer for AIVA
 """
 import logging
 from typing import Dict, List, Optional
-from perception import get_flipkart_candidates, create_edge_driver
+from perception import get_flipkart_candidates, get_edge_driver, warm_edge_driver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+
+# For every result card: its price in rupees and product link (null when missing), read in one call
+_CARDS_JS = """
+const [cardXPath, priceXPath, linkXPath] = arguments;
+// Per-card expressions are compiled once and evaluated against each card
+const priceExpr = document.createExpression(priceXPath, null);
+const linkExpr = document.createExpression(linkXPath, null);
+const first = (expr, context) =>
+    expr.evaluate(context, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+// "₹1,299" -> 1299; anything else that is not a plain amount -> null
+const rupees = (node) => {
+    if (!node) return null;
+    const digits = (node.innerText || node.textContent || '').replace(/₹|,/g, '').trim();
+    return /^\d+$/.test(digits) ? Number(digits) : null;
+};
+const snapshot = document.evaluate(cardXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const cards = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const card = snapshot.snapshotItem(i);
+    const price = first(priceExpr, card);
+    const link = first(linkExpr, card);
+    cards.push({
+        price: rupees(price),
+        href: link ? link.href : null,
+    });
+}
+return cards;
+"""
+_CARD_XPATH = '//div[contains(@class, "_1AtVbE")]'
+_PRICE_XPATH = './/div[contains(@class, "_30jeq3")]'
+_LINK_XPATH = './/a[@href]'
 
 def execute_flipkart_search(product: str, price_limit: Optional[int] = None) -> List[Dict]:
     """Execute search on Flipkart and return candidates."""
@@ -21,7 +51,7 @@ def execute_flipkart_search(product: str, price_limit: Optional[int] = None) ->
 def execute_add_to_cart(product: str, price_limit: Optional[int] = None) -> str:
     """Execute add to cart action on Flipkart."""
     try:
-        driver = create_edge_driver()
+        driver = get_edge_driver()
     except Exception as e:
         return f"❌ Could not start browser: {e}"
     
@@ -43,40 +73,40 @@ def execute_add_to_cart(product: str, price_limit: Optional[int] = None) -> str:
         search_box.send_keys("\n")
         
         # Wait for results and click first item
-        wait.until(EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "_1AtVbE")]')))
-        time.sleep(2)
+        wait.until(EC.presence_of_element_located((By.XPATH, _CARD_XPATH)))
         
-        # Find first product within price limit
-        cards = driver.find_elements(By.XPATH, '//div[contains(@class, "_1AtVbE")]')
+        # Find first product within price limit; parsed prices and links of all cards come back in one call
+        cards = driver.execute_script(_CARDS_JS, _CARD_XPATH, _PRICE_XPATH, _LINK_XPATH)
         for card in cards:
-            try:
-                price_el = card.find_element(By.XPATH, './/div[contains(@class, "_30jeq3")]')
-                price_str = price_el.text.replace('₹', '').replace(',', '').strip()
-                price = int(price_str)
-                
-                if price_limit and price > price_limit:
-                    continue
-                
-                # Click on the product
-                title_el = card.find_element(By.XPATH, './/div[contains(@class, "_4rR01T") or contains(@class, "s1Q9rs")]')
-                title_el.click()
-                break
-            except Exception:
+            price = card['price']
+            if price is None or card['href'] is None:
                 continue
+            if price_limit and price > price_limit:
+                continue
+            
+            # Open the product page directly; one navigation instead of a click that may open a new tab
+            driver.get(card['href'])
+            break
         
         # Try to add to cart
         try:
             add_to_cart_btn = wait.until(EC.element_to_be_clickable((By.XPATH, '//button[contains(@class, "_2KpZ6l") and contains(text(), "ADD TO CART")]')))
             add_to_cart_btn.click()
-            time.sleep(2)
-            return "✅ Item successfully added to cart!"
         except Exception:
             return "❌ Could not find 'Add to Cart' button."
+        
+        # Return as soon as the cart opens or the page confirms the add
+        try:
+            WebDriverWait(driver, 5).until(EC.any_of(
+                EC.url_contains('/cart'),
+                EC.presence_of_element_located((By.XPATH, '//*[contains(text(), "added")]'))
+            ))
+        except Exception:
+            pass
+        return "✅ Item successfully added to cart!"
     
     except Exception as e:
         return f"❌ Error during execution: {e}"
-    finally:
-        driver.quit()
 
 def execute_plan(plan: Dict) -> str:
     """Execute a plan from the agentic core."""
@@ -105,6 +135,7 @@ def execute_plan(plan: Dict) -> str:
 
 if __name__ == "__main__":
     print("AIVA Executor Demo")
+    warm_edge_driver()  # The browser starts while the plan is typed
     action = input("Action (search/add_to_cart): ")
     product = input("Product: ")
     price = input("Max price (optional): ")
@@ -72,7 +72,7 @@ class BlinkitAdapter(GroceryWebsiteAdapter):
             
             # Wait for page to fully load
             try:
-                WebDriverWait(self.driver, 10).until(
+                self.wait.until(
                     lambda d: d.execute_script("return document.readyState") == "complete"
                 )
             except:
@@ -747,7 +747,12 @@ class BlinkitAdapter(GroceryWebsiteAdapter):
             try:
                 add_button.click()
                 print("   ✅ Clicked add to cart button")
-                time.sleep(2)
+                
+                # The ADD button is swapped for a quantity stepper once the cart updates
+                try:
+                    WebDriverWait(self.driver, 5, poll_frequency=0.2).until(EC.invisibility_of_element(add_button))
+                except TimeoutException:
+                    print("   ⚠️ Cart update not confirmed, continuing")
                 
                 # Handle quantity if needed
                 if quantity > 1:
@@ -9,6 +9,20 @@ from typing import Dict, List, Optional, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
+# orjson is optional; the data file is read and written as UTF-8 bytes with either backend
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
 @dataclass
 class GroceryItem:
     """Represents a grocery item with details."""
@@ -174,8 +188,8 @@ class GroceryListManager:
         """Load grocery data from file."""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    data = _json_loads(f.read())
                     self.items_db = data.get('items_db', {})
                     self.lists = data.get('lists', {})
                     self.user_preferences = data.get('preferences', {})
@@ -194,8 +208,8 @@ class GroceryListManager:
                 'preferences': self.user_preferences,
                 'last_updated': datetime.now().isoformat()
             }
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(self.data_file, 'wb') as f:
+                f.write(_json_dumps(data))
             print("✅ Grocery data saved successfully")
         except Exception as e:
             print(f"❌ Error saving grocery data: {e}")
@@ -15,6 +15,7 @@ def check_and_install_packages():
         'webdriver_manager': 'webdriver-manager',
         'speech_recognition': 'SpeechRecognition',
         'pyttsx3': 'pyttsx3',
+        'numpy': 'numpy',
         'tkinter': None  # Built-in with Python
     }
     
@@ -211,7 +212,7 @@ def main():
     if not check_and_install_packages():
         print("\n❌ Dependency installation failed.")
         print("Please install required packages manually:")
-        print("pip install selenium webdriver-manager SpeechRecognition pyttsx3")
+        print("pip install selenium webdriver-manager SpeechRecognition pyttsx3 numpy")
         input("\nPress Enter to continue anyway...")
     
     # Show menu
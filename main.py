@@ -2,8 +2,12 @@
 main.py: Main entry point for AIVA - Agentic Intelligent Voice Assistant
 """
 from interactive_session import InteractiveAIVA
+import re
 import sys
 
+# "under 5000" style price limit in the user's request
+_PRICE_LIMIT_RE = re.compile(r'under (\d+)')
+
 def main():
     """Main entry point for AIVA."""
     print("🚀 AIVA - Agentic Intelligent Voice Assistant")
@@ -42,8 +46,7 @@ def main():
                 price_limit = None
                 
                 # Simple price extraction
-                import re
-                price_match = re.search(r'under (\d+)', user_input.lower())
+                price_match = _PRICE_LIMIT_RE.search(user_input.lower())
                 if price_match:
                     price_limit = int(price_match.group(1))
                 
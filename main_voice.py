@@ -9,8 +9,8 @@ import os
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from voice_enabled_aiva import VoiceEnabledAIVA
-from multi_website_aiva import MultiWebsiteAIVA
+# The AIVA front-ends pull in Selenium and the voice stack, so they are
+# imported only once the user has picked a mode.
 
 def display_welcome():
     """Display welcome message and options."""
@@ -53,6 +53,7 @@ def run_voice_enabled_aiva():
     print("💡 Tip: You can speak or type your responses")
     print("-" * 50)
     
+    from voice_enabled_aiva import VoiceEnabledAIVA
     aiva = VoiceEnabledAIVA()
     aiva.run()
 
@@ -62,6 +63,7 @@ def run_text_only_aiva():
     print("💡 Traditional keyboard input mode")
     print("-" * 50)
     
+    from multi_website_aiva import MultiWebsiteAIVA
     aiva = MultiWebsiteAIVA()
     aiva.run()
 
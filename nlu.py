@@ -5,47 +5,107 @@ nlu.py: Minimal NLU (Natural Language Understanding) module for AIVA
 - Provides parse_command() function
 """
 import re
+import string
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
-def parse_command(command: str) -> Dict[str, Any]:
-    """Extracts intent and entities from a user command string."""
-    # Example: "Find budget smartphones under 20k on Flipkart."
-    # Intent: search_product, Entities: product_name, price_range, platform
-    intent = "search_product"
-    product_name = None
+# Compiled once at import; parse_command runs on every user command
+# (keywords are word-anchored and listed longest-first so "thunder 500" is not a price)
+_PRICE_RE = re.compile(r"\b(?:less than|below|under|up to|upto)\s*₹?\s*([\d,]+[kK]?)", re.I)
+_PLATFORM_RE = re.compile(r"\b(flipkart|amazon|myntra|zomato|swiggy)", re.I)
+
+# Full-width/Devanagari digits, dashes and smart quotes mapped to ASCII in one pass
+_NORMALIZE = str.maketrans({
+    **{chr(0xFF10 + d): str(d) for d in range(10)},
+    **{chr(0x0966 + d): str(d) for d in range(10)},
+    "，": ",", "–": "-", "—": "-",
+    "‘": "'", "’": "'", "“": '"', "”": '"',
+})
+
+# Words dropped from the product name; matched per token instead of via regex
+_STOPWORDS = frozenset({
+    "find", "search", "show", "for", "under", "below", "upto", "on", "in",
+    "buy", "order", "please", "want", "need", "get", "rs", "rupees",
+    "flipkart", "amazon", "myntra", "zomato", "swiggy",
+})
+_STOP_PHRASES = frozenset({("less", "than"), ("up", "to")})
+_TOKEN_STRIP = string.punctuation + "₹"
+
+# Currency written onto the amount itself, as in Rs.500 or ₹500; longest first
+_CURRENCY_PREFIXES = ("rs.", "rs", "₹")
+
+def _is_amount(word: str) -> bool:
+    """True for price tokens such as 20k, 15000, 10,000 or Rs.500."""
+    for prefix in _CURRENCY_PREFIXES:
+        if word.startswith(prefix):
+            word = word[len(prefix):]
+            break
+    if word.endswith("k"):
+        word = word[:-1]
+    return word.replace(",", "").isdigit()
+
+def _strip_stopwords(command: str) -> str:
+    """Removes stopwords, amounts and platform names, keeping the remaining words."""
+    tokens = command.split()
+    keys = [token.strip(_TOKEN_STRIP).lower() for token in tokens]
+    kept = []
+    i = 0
+    while i < len(tokens):
+        if i + 1 < len(keys) and (keys[i], keys[i + 1]) in _STOP_PHRASES:
+            i += 2
+            continue
+        key = keys[i]
+        if key and key not in _STOPWORDS and not _is_amount(key):
+            kept.append(tokens[i])
+        i += 1
+    return " ".join(kept)
+
+@lru_cache(maxsize=256)
+def _extract_entities(command: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+    """Returns (product_name, price_range, platform); cached since commands repeat within a session."""
+    command = command.translate(_NORMALIZE)
     price_range = None
     platform = None
 
     # Price extraction (e.g., under 20k, below 15000, less than 10,000)
-    price_match = re.search(r"(?:under|below|less than|upto|up to)\s*₹?\s*([\d,]+[kK]?)", command, re.I)
+    price_match = _PRICE_RE.search(command)
     if price_match:
-        price_str = price_match.group(1).replace(",", "").lower()
-        if price_str.endswith("k"):
-            price_range = int(float(price_str[:-1]) * 1000)
-        else:
-            try:
+        price_str = price_match[1].replace(",", "").lower()
+        # A match of only commas (e.g. "under ,k") leaves no digits to convert
+        try:
+            if price_str.endswith("k"):
+                price_range = int(float(price_str[:-1]) * 1000)
+            else:
                 price_range = int(price_str)
-            except Exception:
-                price_range = None
+        except ValueError:
+            price_range = None
 
     # Platform extraction (Flipkart, Amazon, etc.)
-    plat_match = re.search(r"(flipkart|amazon|myntra|zomato|swiggy)", command, re.I)
+    plat_match = _PLATFORM_RE.search(command)
     if plat_match:
-        platform = plat_match.group(1).lower()
+        platform = plat_match[1].lower()
 
     # Product/entity extraction (remove stopwords and platform)
-    cleaned = re.sub(r"\b(?:find|search|show|for|under|below|less than|upto|up to|on|in|buy|order|please|want|need|get|rs|rupees|₹|[\d,]+[kK]?|flipkart|amazon|myntra|zomato|swiggy)\b", "", command, flags=re.I)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    cleaned = _strip_stopwords(command)
     product_name = cleaned if cleaned else None
 
+    return product_name, price_range, platform
+
+def parse_command(command: str) -> Dict[str, Any]:
+    """Extracts intent and entities from a user command string."""
+    # Example: "Find budget smartphones under 20k on Flipkart."
+    # Intent: search_product, Entities: product_name, price_range, platform
+    intent = "search_product"
+    product_name, price_range, platform = _extract_entities(command)
+
     result = {
         "intent": intent,
         "product_name": product_name,
         "price_range": price_range,
         "platform": platform
     }
-    logging.info(f"NLU parsed: {result}")
+    logging.info("NLU parsed: %s", result)
     return result
 
 if __name__ == "__main__":
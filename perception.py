@@ -4,21 +4,30 @@ perception.py: Minimal Perception Layer for AIVA
 - For demo: only Flipkart, using Selenium
 - Provides get_flipkart_candidates() function
 """
+import atexit
+import concurrent.futures
 import logging
+import threading
 from typing import List, Dict, Optional
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import re
 import time
 
+# First run of digits in a card's price text; compiled once for the per-card loop
+_PRICE_DIGITS_RE = re.compile(r'\d+')
+
 def create_edge_driver() -> webdriver.Edge:
     from selenium.webdriver.edge.service import Service
     from selenium.webdriver.common.service import utils
     
     opts = EdgeOptions()
+    opts.page_load_strategy = "eager"  # Continue at DOMContentLoaded; results are waited for explicitly
     opts.add_argument("--start-maximized")
     opts.add_argument("--disable-notifications")
     opts.add_argument("--disable-infobars")
@@ -44,6 +53,7 @@ def create_edge_driver() -> webdriver.Edge:
             try:
                 from selenium.webdriver.chrome.options import Options as ChromeOptions
                 chrome_opts = ChromeOptions()
+                chrome_opts.page_load_strategy = "eager"
                 chrome_opts.add_argument("--start-maximized")
                 chrome_opts.add_argument("--disable-notifications")
                 chrome_opts.add_argument("--disable-infobars")
@@ -55,10 +65,128 @@ def create_edge_driver() -> webdriver.Edge:
             except Exception as e3:
                 raise Exception(f"Could not create webdriver. Edge error: {e1}, WebDriver Manager error: {e2}, Chrome error: {e3}")
 
+# Product card, title and price XPaths tried in order; the fallback takes any element with a price
+_CARD_SELECTORS = [
+    '//div[contains(@class, "_1AtVbE")]',
+    '//div[contains(@class, "_2kHMtA")]',
+    '//div[contains(@class, "_1YokD2")]',
+    '//div[contains(@class, "col-12")]',
+    '//div[contains(@data-id, "")]',
+    '//a[contains(@class, "_1fQZEK")]'
+]
+_FALLBACK_CARD_SELECTOR = '//div[contains(text(), "₹") or contains(text(), "Price")]/..'
+_TITLE_SELECTORS = [
+    './/div[contains(@class, "_4rR01T")]',
+    './/div[contains(@class, "s1Q9rs")]',
+    './/a[contains(@class, "IRpwTa")]',
+    './/span[contains(@class, "_35KyD6")]',
+    './/h3',
+    './/h4',
+    './/div[@class="KzDlHZ"]',
+    './/span[@class="_35KyD6"]'
+]
+_PRICE_SELECTORS = [
+    './/div[contains(@class, "_30jeq3")]',
+    './/div[contains(@class, "_1_TelR")]',
+    './/span[contains(@class, "_1_TelR")]',
+    './/*[contains(text(), "₹")]',
+    './/div[contains(text(), "₹")]'
+]
+
+# Returns the cards of the first card selector that matches (or the fallback) and, for
+# each of the first `limit` cards, the trimmed text of every title/price XPath (null if absent)
+_CANDIDATES_JS = """
+const [cardXPaths, fallbackXPath, titleXPaths, priceXPaths, limit] = arguments;
+const all = (xpath) => {
+    const snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+};
+// Per-card expressions are compiled once and evaluated against each card
+const compile = (xpaths) => xpaths.map(xpath => document.createExpression(xpath, null));
+const titleExprs = compile(titleXPaths), priceExprs = compile(priceXPaths);
+const textAt = (expr, card) => {
+    const node = expr.evaluate(card, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    return node ? (node.innerText || node.textContent || '').trim() : null;
+};
+let cards = [], selector = null;
+for (const xpath of cardXPaths) {
+    cards = all(xpath);
+    if (cards.length) { selector = xpath; break; }
+}
+if (!cards.length) cards = all(fallbackXPath);
+return {
+    selector: selector,
+    count: cards.length,
+    cards: cards.slice(0, limit).map(card => ({
+        titles: titleExprs.map(expr => textAt(expr, card)),
+        prices: priceExprs.map(expr => textAt(expr, card)),
+    })),
+};
+"""
+
+# One browser shared by every search and cart action; created by warm_edge_driver()
+_driver_future: Optional[concurrent.futures.Future] = None
+_driver_lock = threading.Lock()
+
+def _create_into(future: concurrent.futures.Future) -> None:
+    try:
+        future.set_result(create_edge_driver())
+    except Exception as e:
+        future.set_exception(e)
+
+def warm_edge_driver() -> None:
+    """Start the shared browser in the background so it is ready by the first command."""
+    global _driver_future
+    with _driver_lock:
+        if _driver_future is None:
+            _driver_future = concurrent.futures.Future()
+            threading.Thread(target=_create_into, args=(_driver_future,), daemon=True).start()
+
+def get_edge_driver(timeout: float = 60):
+    """Returns the shared browser, waiting for a warm-up in progress; recreated once if it failed or was closed."""
+    global _driver_future
+    for attempt in range(2):
+        warm_edge_driver()
+        future = _driver_future
+        try:
+            driver = future.result(timeout)
+            driver.current_url  # Raises if the window was closed
+            return driver
+        except concurrent.futures.TimeoutError:
+            raise
+        except Exception:
+            with _driver_lock:
+                stale = _driver_future is future
+                if stale:
+                    _driver_future = None
+            # A browser that started but no longer responds still holds its driver process
+            if stale and future.exception() is None:
+                try:
+                    future.result().quit()
+                except WebDriverException:
+                    pass
+            if attempt:
+                raise
+
+def close_edge_driver() -> None:
+    """Quits the shared browser if it was started."""
+    global _driver_future
+    with _driver_lock:
+        future, _driver_future = _driver_future, None
+    if future is not None and future.done() and future.exception() is None:
+        try:
+            future.result().quit()
+        except Exception:
+            pass
+
+atexit.register(close_edge_driver)
+
 def get_flipkart_candidates(product: str, price_limit: Optional[int] = None, max_items: int = 5) -> List[Dict]:
     """Searches Flipkart for a product and extracts item titles and prices."""
     try:
-        driver = create_edge_driver()
+        driver = get_edge_driver()
     except Exception as e:
         logging.error(f"Could not create driver: {e}")
         return []
@@ -82,93 +210,47 @@ def get_flipkart_candidates(product: str, price_limit: Optional[int] = None, max
         # Wait for results with multiple possible selectors
         time.sleep(3)  # Give page time to load
         
-        # Try multiple selectors for product cards
-        items = []
-        possible_selectors = [
-            '//div[contains(@class, "_1AtVbE")]',
-            '//div[contains(@class, "_2kHMtA")]',
-            '//div[contains(@class, "_1YokD2")]',
-            '//div[contains(@class, "col-12")]',
-            '//div[contains(@data-id, "")]',
-            '//a[contains(@class, "_1fQZEK")]'
-        ]
-        
-        cards = []
-        for selector in possible_selectors:
-            try:
-                cards = driver.find_elements(By.XPATH, selector)
-                if cards:
-                    logging.info(f"Found {len(cards)} elements with selector: {selector}")
-                    break
-            except Exception:
-                continue
-        
-        if not cards:
+        # Cards and their title/price texts are read in one script call instead of
+        # a find_element round-trip per selector per card
+        result = driver.execute_script(_CANDIDATES_JS, _CARD_SELECTORS, _FALLBACK_CARD_SELECTOR,
+                                       _TITLE_SELECTORS, _PRICE_SELECTORS, max_items * 2)
+        if result['selector']:
+            logging.info(f"Found {result['count']} elements with selector: {result['selector']}")
+        else:
             logging.warning("No product cards found, trying generic approach")
-            # Try to find any clickable elements with text that might be products
-            cards = driver.find_elements(By.XPATH, '//div[contains(text(), "₹") or contains(text(), "Price")]/..')
         
-        for card in cards[:max_items * 2]:  # Get more than needed in case some fail
-            try:
-                # Try multiple ways to get title
-                title = None
-                title_selectors = [
-                    './/div[contains(@class, "_4rR01T")]',
-                    './/div[contains(@class, "s1Q9rs")]',
-                    './/a[contains(@class, "IRpwTa")]',
-                    './/span[contains(@class, "_35KyD6")]',
-                    './/h3',
-                    './/h4',
-                    './/div[@class="KzDlHZ"]',
-                    './/span[@class="_35KyD6"]'
-                ]
-                
-                for sel in title_selectors:
-                    try:
-                        title_el = card.find_element(By.XPATH, sel)
-                        title = title_el.text.strip()
-                        if title and len(title) > 5:  # Basic validation
-                            break
-                    except Exception:
-                        continue
-                
-                if not title:
+        items = []
+        for card in result['cards']:  # Get more than needed in case some fail
+            # Try multiple ways to get title
+            title = None
+            for text in card['titles']:
+                if text is None:
                     continue
-                
-                # Try multiple ways to get price
-                price = None
-                price_selectors = [
-                    './/div[contains(@class, "_30jeq3")]',
-                    './/div[contains(@class, "_1_TelR")]',
-                    './/span[contains(@class, "_1_TelR")]',
-                    './/*[contains(text(), "₹")]',
-                    './/div[contains(text(), "₹")]'
-                ]
-                
-                for sel in price_selectors:
-                    try:
-                        price_el = card.find_element(By.XPATH, sel)
-                        price_text = price_el.text.replace('₹', '').replace(',', '').strip()
-                        # Extract just the numbers
-                        import re
-                        price_match = re.search(r'\d+', price_text)
-                        if price_match:
-                            price = int(price_match.group())
-                            break
-                    except Exception:
-                        continue
-                
-                if price_limit and price and price > price_limit:
+                title = text
+                if title and len(title) > 5:  # Basic validation
+                    break
+            
+            if not title:
+                continue
+            
+            # Try multiple ways to get price
+            price = None
+            for text in card['prices']:
+                if text is None:
                     continue
-                
-                if title and price:
-                    items.append({"title": title, "price": price})
-                    if len(items) >= max_items:
-                        break
-                        
-            except Exception as e:
-                logging.debug(f"Error processing card: {e}")
+                # Extract just the numbers
+                price_match = _PRICE_DIGITS_RE.search(text.replace('₹', '').replace(',', ''))
+                if price_match:
+                    price = int(price_match.group())
+                    break
+            
+            if price_limit and price and price > price_limit:
                 continue
+            
+            if title and price:
+                items.append({"title": title, "price": price})
+                if len(items) >= max_items:
+                    break
         
         logging.info(f"Found {len(items)} items on Flipkart.")
         return items
@@ -176,11 +258,10 @@ def get_flipkart_candidates(product: str, price_limit: Optional[int] = None, max
     except Exception as e:
         logging.error(f"Error during Flipkart search: {e}")
         return []
-    finally:
-        driver.quit()
 
 if __name__ == "__main__":
     print("AIVA Perception Demo: Search Flipkart for a product.")
+    warm_edge_driver()  # The browser starts while the product is typed
     prod = input("Product name: ")
     price = input("Max price (optional): ")
     price_limit = int(price) if price.strip().isdigit() else None
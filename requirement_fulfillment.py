@@ -2,6 +2,20 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional
 import re
 
+# All budget phrasings as one alternation so a query is scanned once.
+# _BUDGET_KINDS lists the group names in precedence order.
+_BUDGET_RE = re.compile(
+    r'under\s+(?P<under>\d+)'
+    r'|below\s+(?P<below>\d+)'
+    r'|budget\s+(?P<budget>\d+)'
+    r'|(?P<rupees>\d+)\s*rupees?'
+    r'|rs\.?\s*(?P<rs>\d+)'
+    r'|₹\s*(?P<inr>\d+)'
+    r'|between\s+(?P<between>\d+\s+and\s+\d+)'
+    r'|from\s+(?P<from>\d+\s+to\s+\d+)'
+)
+_BUDGET_KINDS = ('under', 'below', 'budget', 'rupees', 'rs', 'inr', 'between', 'from')
+
 @dataclass
 class UserRequirement:
     product_name: str
@@ -21,31 +35,25 @@ class RequirementAnalyzer:
         budget_max = None
         
         # Look for budget patterns like "under 5000", "between 1000 and 3000", "budget 2000"
-        budget_patterns = [
-            r'under\s+(\d+)',
-            r'below\s+(\d+)', 
-            r'budget\s+(\d+)',
-            r'(\d+)\s*rupees?',
-            r'rs\.?\s*(\d+)',
-            r'₹\s*(\d+)',
-            r'between\s+(\d+)\s+and\s+(\d+)',
-            r'from\s+(\d+)\s+to\s+(\d+)'
-        ]
-        
-        for pattern in budget_patterns:
-            matches = re.findall(pattern, query_lower)
-            if matches:
-                if 'between' in pattern or 'from' in pattern:
-                    # Range pattern
-                    budget_min = float(matches[0][0])
-                    budget_max = float(matches[0][1])
-                else:
-                    # Single value pattern
-                    if 'under' in pattern or 'below' in pattern:
-                        budget_max = float(matches[0])
-                    else:
-                        budget_min = float(matches[0])
-                break
+        # in a single scan; the first pattern kind (in precedence order) wins
+        found = {}
+        for match in _BUDGET_RE.finditer(query_lower):
+            found.setdefault(match.lastgroup, match[match.lastgroup])
+        
+        for kind in _BUDGET_KINDS:
+            if kind not in found:
+                continue
+            value = found[kind]
+            if kind in ('between', 'from'):
+                # Range pattern
+                parts = value.split()
+                budget_min = float(parts[0])
+                budget_max = float(parts[-1])
+            elif kind in ('under', 'below'):
+                budget_max = float(value)
+            else:
+                budget_min = float(value)
+            break
         
         # Extract category
         category = "general"
@@ -114,82 +122,93 @@ class ProductRecommendationEngine:
         
         print(f"🎯 Ranking {len(products)} products for Amazon...")
         
-        # Enhanced filtering and scoring
-        scored_products = []
+        # Imported here so loading the GUI does not pull in NumPy before the first ranking
+        import numpy as np
         
-        for product in products:
-            score = self._calculate_product_score(product, requirements)
-            if score > 0:  # Only include products with positive scores
-                product['_ranking_score'] = score
-                scored_products.append(product)
+        # Price terms are scored for all products at once; only the title
+        # keyword matching still runs per product
+        prices = np.fromiter((p.get('price', 0) for p in products), dtype=np.float64, count=len(products))
+        text_scores = np.fromiter((self._calculate_text_score(p.get('title', '').lower(), requirements)
+                                   for p in products), dtype=np.float64, count=len(products))
         
-        # Sort by score (descending - highest score first)
-        scored_products.sort(key=lambda p: p.get('_ranking_score', 0), reverse=True)
+        scores = self._calculate_price_scores(prices, requirements) * self.amazon_ranking_weights['price_match']
+        scores += text_scores
         
-        print(f"✅ Ranked products - Top choice: {scored_products[0]['title'][:40]}... (Score: {scored_products[0]['_ranking_score']:.2f})")
+        # Minimum score for budget-compliant products, exclude the rest
+        scores = np.where(self._within_budget_mask(prices, requirements), np.maximum(scores, 0.3), 0.0)
+        
+        # Sort by score (descending - highest score first), keeping only positive scores
+        scored_products = []
+        for i in np.argsort(-scores, kind='stable'):
+            if scores[i] <= 0:
+                break
+            product = products[i]
+            product['_ranking_score'] = float(scores[i])
+            scored_products.append(product)
+        
+        if scored_products:
+            print(f"✅ Ranked products - Top choice: {scored_products[0]['title'][:40]}... (Score: {scored_products[0]['_ranking_score']:.2f})")
         
         return scored_products
     
-    def _calculate_product_score(self, product, requirements):
-        """Calculate ranking score for a product"""
+    def _calculate_text_score(self, title, requirements):
+        """Weighted brand, feature, category and badge score for a product title"""
         score = 0.0
-        title = product.get('title', '').lower()
-        price = product.get('price', 0)
-        
-        # 1. Price matching score
-        price_score = self._calculate_price_score(price, requirements)
-        score += price_score * self.amazon_ranking_weights['price_match']
         
-        # 2. Brand preference matching
+        # Brand preference matching
         if requirements.brand_preference:
             brand_score = self._calculate_brand_score(title, requirements.brand_preference)
             score += brand_score * self.amazon_ranking_weights['brand_match']
         
-        # 3. Feature matching
+        # Feature matching
         if requirements.features:
             feature_score = self._calculate_feature_score(title, requirements.features)
             score += feature_score * self.amazon_ranking_weights['feature_match']
         
-        # 4. Category-specific preferences
+        # Category-specific preferences
         category_score = self._calculate_category_score(title, requirements.category)
         score += category_score * self.amazon_ranking_weights['feature_match']
         
-        # 5. Amazon-specific bonuses
+        # Amazon-specific bonuses
         amazon_score = self._calculate_amazon_bonuses(title)
         score += amazon_score * self.amazon_ranking_weights['rating_boost']
         
-        # Ensure minimum score for budget-compliant products
-        if self._is_within_budget(price, requirements):
-            score = max(score, 0.3)  # Minimum score for budget-compliant items
-        else:
-            score = 0  # Exclude if outside budget
-        
         return score
     
-    def _calculate_price_score(self, price, requirements):
-        """Score based on how well price fits budget"""
-        if price <= 0:
-            return 0
+    def _calculate_price_scores(self, prices, requirements):
+        """Score an array of prices by how well each fits the budget"""
+        import numpy as np
         
         # If no budget specified, prefer mid-range items
         if not requirements.budget_min and not requirements.budget_max:
-            return 0.5
+            return np.where(prices > 0, 0.5, 0.0)
         
         budget_min = requirements.budget_min or 0
         budget_max = requirements.budget_max or float('inf')
         
-        if price < budget_min or price > budget_max:
-            return 0  # Outside budget
-        
-        # Score higher for prices closer to the middle of budget range
         if budget_max != float('inf'):
+            # Score higher for prices closer to the middle of budget range
             budget_middle = (budget_min + budget_max) / 2
-            distance_from_middle = abs(price - budget_middle)
             max_distance = (budget_max - budget_min) / 2
-            return 1.0 - (distance_from_middle / max_distance) if max_distance > 0 else 1.0
-        else:
+            if max_distance > 0:
+                scores = 1.0 - np.abs(prices - budget_middle) / max_distance
+            else:
+                scores = np.ones_like(prices)
+        elif budget_min > 0:
             # Only minimum budget specified - prefer higher value items
-            return min(1.0, price / (budget_min * 2)) if budget_min > 0 else 0.5
+            scores = np.minimum(1.0, prices / (budget_min * 2))
+        else:
+            scores = np.full_like(prices, 0.5)
+        
+        # Outside budget or unpriced
+        return np.where(self._within_budget_mask(prices, requirements), scores, 0.0)
+    
+    def _within_budget_mask(self, prices, requirements):
+        """Boolean mask of prices that are set and within budget"""
+        budget_min = requirements.budget_min or 0
+        budget_max = requirements.budget_max or float('inf')
+        
+        return (prices > 0) & (prices >= budget_min) & (prices <= budget_max)
     
     def _calculate_brand_score(self, title, preferred_brands):
         """Score based on brand preference match"""
@@ -232,16 +251,6 @@ class ProductRecommendationEngine:
                 score += 0.1
         
         return min(score, 0.5)  # Cap bonus at 0.5
-    
-    def _is_within_budget(self, price, requirements):
-        """Check if price is within budget"""
-        if price <= 0:
-            return False
-        
-        budget_min = requirements.budget_min or 0
-        budget_max = requirements.budget_max or float('inf')
-        
-        return budget_min <= price <= budget_max
 
 class SatisfactionChecker:
     def __init__(self, analyzer):
@@ -10,6 +10,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import StaleElementReferenceException
 import time
 import re
 
@@ -19,6 +20,9 @@ class WebsiteAdapter(ABC):
     def __init__(self, driver: webdriver.Chrome, wait: WebDriverWait):
         self.driver = driver
         self.wait = wait
+        # Short, tightly polled wait for elements on an already loaded page
+        self.fast_wait = WebDriverWait(driver, 3, poll_frequency=0.1,
+                                       ignored_exceptions=(StaleElementReferenceException,))
         self.name = self.__class__.__name__.replace('Adapter', '').lower()
     
     @abstractmethod
@@ -264,7 +268,7 @@ class FlipkartAdapter(WebsiteAdapter):
                     print(f"      Trying selector {i}/{len(add_to_cart_selectors)}: {selector}")
                     
                     # Use WebDriverWait for better reliability
-                    add_btn = WebDriverWait(self.driver, 3).until(
+                    add_btn = self.fast_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                     )
                     
@@ -468,7 +472,7 @@ class AmazonAdapter(WebsiteAdapter):
                         
                         # Wait for the main Amazon page elements to appear
                         try:
-                            WebDriverWait(self.driver, 10).until(
+                            self.wait.until(
                                 EC.presence_of_element_located((By.CSS_SELECTOR, "#nav-logo"))
                             )
                             print("   ✅ Main Amazon page loaded")
@@ -524,7 +528,7 @@ class AmazonAdapter(WebsiteAdapter):
             
             # Wait longer for initial page load
             print("   Waiting for Amazon page to load...")
-            WebDriverWait(self.driver, 15).until(
+            WebDriverWait(self.driver, 15, poll_frequency=0.1).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
             time.sleep(2)
@@ -549,7 +553,7 @@ class AmazonAdapter(WebsiteAdapter):
             for selector in search_selectors:
                 try:
                     # Wait for each selector to be clickable
-                    search_box = WebDriverWait(self.driver, 5).until(
+                    search_box = WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                     )
                     print(f"   ✅ Found search box: {selector}")
@@ -576,7 +580,7 @@ class AmazonAdapter(WebsiteAdapter):
             
             for selector in search_btn_selectors:
                 try:
-                    search_btn = WebDriverWait(self.driver, 3).until(
+                    search_btn = self.fast_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                     )
                     search_btn.click()
@@ -797,7 +801,7 @@ class AmazonAdapter(WebsiteAdapter):
                     print(f"      Trying selector {i}/{len(add_to_cart_selectors)}: {selector}")
                     
                     # Use WebDriverWait for better reliability
-                    add_btn = WebDriverWait(self.driver, 3).until(
+                    add_btn = self.fast_wait.until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
                     )
                     